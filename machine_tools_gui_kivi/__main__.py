@@ -4,20 +4,50 @@
 """
 Точка входа в приложение.
 Запускает GUI приложение для работы с базой данных станков.
+
+Команды:
+    run [--offline] [--replica PATH] [--pool-size N] - запуск приложения
+        (с ключом --offline - только чтение из локальной реплики, созданной командой replicate)
+    replicate [--replica PATH] - копирование данных станков из базы данных в локальную реплику SQLite
 """
 
 import argparse
-from machine_tools_gui_kivi.app.app import WorkshopDesignApp
+
+from machine_tools_gui_kivi.src.machine_finder import replicate, use_local_replica
 
 
 def main():
     """Основная функция запуска приложения."""
     parser = argparse.ArgumentParser(description="Machine Tools GUI Application")
-    parser.add_argument("command", choices=["run"], help="Command to execute")
+    parser.add_argument(
+        "command",
+        choices=["run", "replicate"],
+        help="Command to execute: run - start the application, replicate - copy the database to a local replica",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Run in read-only mode using the local SQLite replica instead of the database",
+    )
+    parser.add_argument("--replica", default=None, help="Path to the local SQLite replica file")
+    parser.add_argument(
+        "--pool-size", type=int, default=4, help="Maximum number of simultaneously open database connections"
+    )
     args = parser.parse_args()
 
     if args.command == "run":
-        WorkshopDesignApp().run()
+        if args.offline:
+            try:
+                use_local_replica(args.replica)
+            except FileNotFoundError as error:
+                parser.error(str(error))
+        # Импортируем приложение только для команды run: остальным командам не нужен Kivy
+        from machine_tools_gui_kivi.app.app import WorkshopDesignApp
+
+        WorkshopDesignApp(pool_size=args.pool_size).run()
+    elif args.command == "replicate":
+        count = replicate(args.replica)
+        print(f"Скопировано станков в локальную реплику: {count}")
 
 
 if __name__ == "__main__":
@@ -11,7 +11,9 @@ from kivy.uix.screenmanager import Screen, ScreenManager
 from kivymd.app import MDApp
 from kivymd.uix.screen import MDScreen
 
-from machine_tools_gui_kivi.app.windows import DatabaseEditorWindow
+from machine_tools_gui_kivi.app.windows import DatabaseEditorWindow, MachineTableWindow
+from machine_tools_gui_kivi.src.db_session import DatabaseSessionManager
+from machine_tools_gui_kivi.src.machine_finder import set_session_manager
 from kivy.config import Config
 
 Config.set("input", "mouse", "mouse, multitouch_on_demand")
@@ -31,16 +33,21 @@ class WorkshopDesignApp(MDApp):
         theme_cls: Класс для управления темой приложения
     """
 
-    def __init__(self, theme: str = "Dark", **kwargs):
+    def __init__(self, theme: str = "Dark", pool_size: int = 4, **kwargs):
         """
         Инициализирует приложение.
 
         Args:
             config: Конфигурация приложения
+            pool_size: Максимальное количество одновременно открытых подключений к базе данных
             **kwargs: Дополнительные аргументы
         """
         super().__init__(**kwargs)
 
+        # Создаем общий для всех запросов менеджер подключений к базе данных
+        self.db_sessions = DatabaseSessionManager(pool_size=pool_size)
+        set_session_manager(self.db_sessions)
+
         # Устанавливаем тему
         self.theme_cls.theme_style = theme
 
@@ -65,14 +72,25 @@ class WorkshopDesignApp(MDApp):
         # Создаем менеджер экранов
         self.screen_manager = ScreenManager()
         # Создаем и добавляем окно ввода
-        database_editor = DatabaseEditorWindow(screen_manager=self.screen_manager)
-        self.screen_manager.add_widget(database_editor)
+        self.database_editor = DatabaseEditorWindow(screen_manager=self.screen_manager)
+        self.screen_manager.add_widget(self.database_editor)
+        # Создаем и добавляем окно таблицы станков
+        self.machine_table = MachineTableWindow(screen_manager=self.screen_manager)
+        self.screen_manager.add_widget(self.machine_table)
 
         # Устанавливаем размер окна
         Window.size = (910, 600)
 
         return self.screen_manager
 
+    def on_stop(self):
+        """
+        Дописывает в базу данных изменения, ожидающие записи, и закрывает подключения к базе данных
+        перед завершением работы приложения.
+        """
+        self.database_editor.save_queue.flush(wait=True)
+        self.db_sessions.close()
+
     def toggle_theme(self, instance):
         """Переключает между светлой и темной темой."""
         self.theme_cls.theme_style = "Dark" if self.theme_cls.theme_style == "Light" else "Light"
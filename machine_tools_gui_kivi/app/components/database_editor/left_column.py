@@ -11,13 +11,13 @@ from kivy.uix.label import Label
 from kivy.uix.scrollview import ScrollView
 from machine_tools import Automation, SoftwareControl, Specialization, WeightClass
 
-from machine_tools_gui_kivi.app.components.dropdown_list import DropdownList
+from machine_tools_gui_kivi.app.components.dropdown_list import RecycleDropdownList
 from machine_tools_gui_kivi.app.components.labeled_input import LabeledInput
 from machine_tools_gui_kivi.app.components.labeled_spinner import LabeledSpinner
 from machine_tools_gui_kivi.app.components.searchbar import SearchBar
+from machine_tools_gui_kivi.src.descriptions import GROUP_FIELDS_DESCRIPTIONS
 from machine_tools_gui_kivi.src.descriptions import get_accuracy_fields_descriptions as get_accuracy_fields
-from machine_tools_gui_kivi.src.descriptions import get_group_fields_descriptions as get_group_fields
-from machine_tools_gui_kivi.src.descriptions import get_specialization_fields_descriptions as get_specialization_fields
+from machine_tools_gui_kivi.src.descriptions import get_enum_fields_descriptions as get_enum_fields
 from machine_tools_gui_kivi.src.descriptions import get_type_fields_descriptions as get_type_fields
 
 
@@ -51,6 +51,27 @@ class LeftColumn(BoxLayout):
     Класс левой колонки редактора базы данных.
     """
 
+    # Виджеты формы, значения которых соответствуют полям MachineInfo
+    FORM_WIDGETS = (
+        "group_spinner",
+        "type_spinner",
+        "machine_type_input",
+        "automation_spinner",
+        "software_control_spinner",
+        "power_input",
+        "efficiency_input",
+        "accuracy_spinner",
+        "specialization_spinner",
+        "mass_input",
+        "weight_class_spinner",
+        "length_input",
+        "width_input",
+        "height_input",
+        "overall_diameter_input",
+        "production_city_input",
+        "organization_input",
+    )
+
     def __init__(self, debug_mode=False, **kwargs):
         super().__init__(orientation="vertical", size_hint=(1, 1), spacing=5, padding=[5, 5, 5, 5], **kwargs)
         self.debug_mode = debug_mode
@@ -68,14 +89,14 @@ class LeftColumn(BoxLayout):
         )
 
         # Создаем контейнер для полей ввода
-        fields_container = GridLayout(cols=1, spacing=5, size_hint_y=None, padding=[0, 0, 10, 0])
-        fields_container.bind(minimum_height=fields_container.setter("height"))
+        self.fields_container = GridLayout(cols=1, spacing=5, size_hint_y=None, padding=[0, 0, 10, 0])
+        self.fields_container.bind(minimum_height=self.fields_container.setter("height"))
 
         # Создаем и добавляем все виджеты
-        self._create_widgets(fields_container)
+        self._create_widgets(self.fields_container)
 
         # Добавляем контейнер с полями в ScrollView
-        scroll_view.add_widget(fields_container)
+        scroll_view.add_widget(self.fields_container)
         self.add_widget(scroll_view)
 
     def _create_widgets(self, container):
@@ -93,7 +114,7 @@ class LeftColumn(BoxLayout):
         self.add_widget(self.search_bar)
 
         # Группа станка
-        self.group_spinner = get_custom_spinner("Группа станка:", get_group_fields(), self.debug_mode)
+        self.group_spinner = get_custom_spinner("Группа станка:", list(GROUP_FIELDS_DESCRIPTIONS), self.debug_mode)
         container.add_widget(self.group_spinner)
 
         # Тип станка
@@ -111,11 +132,11 @@ class LeftColumn(BoxLayout):
         # Автоматизация, Признак ЧПУ  в одну строку
         horizontal_container = BoxLayout(orientation="horizontal", size_hint=(1, None), height=65, spacing=5)
         # Автоматизация
-        self.automation_spinner = get_custom_spinner("Автоматизация:", Automation.get_values(), self.debug_mode)
+        self.automation_spinner = get_custom_spinner("Автоматизация:", get_enum_fields(Automation), self.debug_mode)
         horizontal_container.add_widget(self.automation_spinner)
         # Признак ЧПУ
         self.software_control_spinner = get_custom_spinner(
-            "Наличие ЧПУ:", SoftwareControl.get_values(), self.debug_mode
+            "Наличие ЧПУ:", get_enum_fields(SoftwareControl), self.debug_mode
         )
         horizontal_container.add_widget(self.software_control_spinner)
         container.add_widget(horizontal_container)
@@ -135,7 +156,9 @@ class LeftColumn(BoxLayout):
         container.add_widget(self.accuracy_spinner)
 
         # Специализация
-        self.specialization_spinner = get_custom_spinner("Специализация:", Specialization.get_values(), self.debug_mode)
+        self.specialization_spinner = get_custom_spinner(
+            "Специализация:", get_enum_fields(Specialization), self.debug_mode
+        )
         container.add_widget(self.specialization_spinner)
 
         # Масса и Класс станка по массе в одну строку
@@ -143,7 +166,7 @@ class LeftColumn(BoxLayout):
         self.mass_input = get_custom_input("Масса:", "кг", debug_mode=self.debug_mode)
         horizontal_container_2.add_widget(self.mass_input)
         self.weight_class_spinner = get_custom_spinner(
-            "Класс станка по массе:", WeightClass.get_values(), self.debug_mode
+            "Класс станка по массе:", get_enum_fields(WeightClass), self.debug_mode
         )
         horizontal_container_2.add_widget(self.weight_class_spinner)
         container.add_widget(horizontal_container_2)
@@ -180,7 +203,7 @@ class LeftColumn(BoxLayout):
         container.add_widget(self.organization_input)
 
         # Добавляем выпадающий список
-        self.search_bar_dropdown = DropdownList(
+        self.search_bar_dropdown = RecycleDropdownList(
             size_hint=(0.4, None),
             height=200,
             item_height=30,
@@ -189,3 +212,42 @@ class LeftColumn(BoxLayout):
             item_cols=2,
             opacity=0,
         )
+
+    def get_form_state(self) -> dict:
+        """Возвращает значения виджетов формы: имя виджета -> текст."""
+        return {name: getattr(self, name).get_value() for name in self.FORM_WIDGETS}
+
+    def is_form_empty(self) -> bool:
+        """Возвращает True, если все виджеты формы пусты."""
+        return not any(getattr(self, name).get_value() for name in self.FORM_WIDGETS)
+
+    def apply_form_state(self, state: dict, type_values: list = None):
+        """
+        Устанавливает значения виджетов формы за один вызов.
+
+        Изменяются только виджеты, значение которых отличается от текущего, поэтому перерисовываются только они,
+        а размещение колонки пересчитывается Kivy один раз в следующем кадре.
+
+        Args:
+            state: Значения виджетов: имя виджета (см. FORM_WIDGETS) -> значение (для выпадающих списков - ключ,
+                см. LabeledSpinner.set_value). None или "" очищает виджет. Не указанные виджеты не изменяются
+            type_values: Пункты списка типов станков; устанавливаются до значений, так как зависят от группы
+        """
+        if type_values is not None and list(self.type_spinner.spinner.values) != list(type_values):
+            self.type_spinner.spinner.values = type_values
+        for name, value in state.items():
+            widget = getattr(self, name)
+            if value is None or value == "":
+                if widget.get_value():
+                    widget.clear_value()
+            elif widget.get_value() != value:
+                widget.set_value(value)
+
+    def clear_form(self):
+        """Очищает виджеты формы. Если форма уже пуста, виджеты не затрагиваются."""
+        if not self.is_form_empty():
+            self.apply_form_state(dict.fromkeys(self.FORM_WIDGETS))
+
+    def set_loading(self, loading: bool):
+        """Блокирует поля ввода на время загрузки данных станка."""
+        self.fields_container.disabled = loading
@@ -21,6 +21,7 @@ class PropertyRow(BoxLayout):
         self.on_value_change = on_value_change
         self.on_name_change = on_name_change
         self._old_name = property_name
+        self._updating = False  # Изменение текста программой, а не пользователем
 
         # Название свойства
         self.name_input = TextInput(
@@ -47,15 +48,28 @@ class PropertyRow(BoxLayout):
 
     def _on_value_change(self, instance, value):
         """Обработчик изменения значения."""
-        if self.on_value_change:
+        if self.on_value_change and not self._updating:
             self.on_value_change(self.name_input.text, value)
 
     def _on_name_change(self, instance, value):
         """Обработчик изменения названия."""
-        if self.on_name_change and value != self._old_name:
+        if self.on_name_change and value != self._old_name and not self._updating:
             self.on_name_change(self._old_name, value)
             self._old_name = value
 
+    def set_property(self, property_name, value):
+        """
+        Заменяет название и значение свойства без вызова обработчиков изменения
+        (строка переиспользуется для другого свойства).
+        """
+        self._updating = True
+        try:
+            self.name_input.text = property_name
+            self._old_name = property_name
+            self.set_value(value)
+        finally:
+            self._updating = False
+
     def set_value(self, value):
         """Устанавливает значение свойства."""
         self.value_input.text = str(value) if value is not None else ""
@@ -73,21 +87,28 @@ class RightColumn(BoxLayout):
     """
     Класс правой колонки редактора базы данных.
     Отображает свойства в виде таблицы с двумя колонками.
+
+    При смене станка строки не пересоздаются: строки свойств, которые есть у нового станка, обновляются на месте,
+    строки удаленных свойств переиспользуются для новых, лишние строки убираются в пул и берутся из него позже.
     """
 
+    TITLE = "Технические характеристики станка"
+    LOADING_TITLE = "Загрузка технических характеристик..."
+
     def __init__(self, debug_mode=False, on_property_change=None, on_property_name_change=None, **kwargs):
         super().__init__(orientation="vertical", size_hint=(1, 1), spacing=2, padding=[2, 2, 2, 2], **kwargs)
         self.debug_mode = debug_mode
         self.on_property_change = on_property_change
         self.on_property_name_change = on_property_name_change
         self._property_rows = {}
+        self._row_pool = []  # Строки, убранные из таблицы и доступные для повторного использования
         self._init_content()
 
     def _init_content(self):
         """Инициализирует контент колонки."""
         # Создаем лейбл для названия таблицы
         self.table_name_label = Label(
-            text="Технические характеристики станка",
+            text=self.TITLE,
             size_hint=(1, None),
             height=30,
             halign="left",
@@ -132,14 +153,24 @@ class RightColumn(BoxLayout):
             property_name: Название свойства
         """
         if property_name not in self._property_rows:
-            row = PropertyRow(
-                property_name,
-                on_value_change=self._on_property_value_change,
-                on_name_change=self._on_property_name_change,
-            )
+            row = self._take_row(property_name, "")
             self._property_rows[property_name] = row
             self.properties_container.add_widget(row)
 
+    def _take_row(self, property_name, value):
+        """Возвращает строку из пула (или новую строку) с заданными названием и значением."""
+        if self._row_pool:
+            row = self._row_pool.pop()
+            row.set_property(property_name, value)
+            return row
+        row = PropertyRow(
+            property_name,
+            on_value_change=self._on_property_value_change,
+            on_name_change=self._on_property_name_change,
+        )
+        row.set_property(property_name, value)
+        return row
+
     def set_property_value(self, property_name, value):
         """
         Устанавливает значение для указанного свойства.
@@ -175,21 +206,59 @@ class RightColumn(BoxLayout):
         return {name: row.get_value() for name, row in self._property_rows.items()}
 
     def clear_properties(self):
-        """Очищает все свойства."""
+        """Очищает все свойства (строки убираются в пул для повторного использования)."""
+        self._row_pool.extend(self._property_rows.values())
         self._property_rows.clear()
         self.properties_container.clear_widgets()
 
     def update_properties(self, properties_dict):
         """
-        Обновляет все свойства из словаря.
+        Обновляет все свойства из словаря, сопоставляя строки по названию свойства.
+
+        Строки свойств, которые остались, обновляются на месте, строки удаленных свойств переиспользуются
+        для добавленных. Обработчики изменения свойств при этом не вызываются.
 
         Args:
             properties_dict: Словарь {название_свойства: значение}
         """
-        self.clear_properties()
+        properties_dict = properties_dict or {}
+        old_rows = self._property_rows
+        # Строки удаленных свойств, доступные для добавленных свойств
+        free_rows = [row for name, row in old_rows.items() if name not in properties_dict]
+        rows = {}
         for name, value in properties_dict.items():
-            self.add_property(name)
-            self.set_property_value(name, value)
+            row = old_rows.get(name)
+            if row is not None:
+                if row.get_value() != ("" if value is None else str(value)):
+                    row.set_property(name, value)
+            elif free_rows:
+                row = free_rows.pop()
+                row.set_property(name, value)
+            else:
+                row = self._take_row(name, value)
+            rows[name] = row
+        self._property_rows = rows
+
+        container = self.properties_container
+        for row in free_rows:
+            container.remove_widget(row)
+        self._row_pool.extend(free_rows)
+        # Расставляем строки в порядке свойств: добавляются новые строки и перемещаются только строки не на своем
+        # месте. children хранит виджеты в обратном порядке, поэтому позиция position - это индекс len - position
+        shown = list(reversed(container.children))
+        for position, row in enumerate(rows.values()):
+            if position < len(shown) and shown[position] is row:
+                continue
+            if row.parent is container:
+                container.remove_widget(row)
+                shown.remove(row)
+            container.add_widget(row, index=len(shown) - position)
+            shown.insert(position, row)
+
+    def set_loading(self, loading: bool):
+        """Показывает состояние загрузки и блокирует таблицу на время загрузки данных станка."""
+        self.table_name_label.text = self.LOADING_TITLE if loading else self.TITLE
+        self.properties_container.disabled = loading
 
     def update_technical_requirements(self, requirements):
         """
@@ -198,10 +267,7 @@ class RightColumn(BoxLayout):
         Args:
             requirements: Словарь технических требований
         """
-        self.clear_properties()
-        for name, value in requirements.items():
-            self.add_property(name)
-            self.set_property_value(name, value)
+        self.update_properties(requirements)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
+import math
+
+from kivy.core.window import Window
 from kivy.uix.button import Button
 from kivy.uix.gridlayout import GridLayout
+from kivy.uix.recyclegridlayout import RecycleGridLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.uix.scrollview import ScrollView
 
 
@@ -58,6 +64,131 @@ class DropdownList(ScrollView):
             self.on_select(value)
 
 
+class RecycleDropdownItem(RecycleDataViewBehavior, Button):
+    """Элемент виртуализированного выпадающего списка. Экземпляры переиспользуются при прокрутке и обновлении."""
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Запоминает список, которому принадлежит элемент, при назначении ему данных."""
+        self.dropdown = rv
+        return super().refresh_view_attrs(rv, index, data)
+
+    def on_release(self):
+        """Обработчик нажатия на элемент."""
+        self.dropdown._on_item_select(self.text)
+
+
+class RecycleDropdownList(RecycleView):
+    """Виртуализированный выпадающий список с прокруткой.
+
+    В отличие от DropdownList виджеты создаются только для видимых строк и переиспользуются
+    при обновлении списка, поэтому стоимость update_items не зависит от количества вариантов.
+
+    Список поддерживает постраничную загрузку: если при обновлении передан has_more=True,
+    то при прокрутке до конца списка вызывается on_load_more, а следующая страница добавляется через append_items.
+
+    Args:
+    on_select - функция, выполняемая при выборе значения из списка вариантов
+    on_highlight - функция, выполняемая при наведении курсора мыши на значение из списка
+    on_load_more - функция, выполняемая при прокрутке до конца списка, если есть следующая страница
+    height - высота списка
+    item_height - высота элемента списка
+    item_spacing - отступ между элементами списка
+    bar_width - ширина полосы прокрутки
+    item_cols - количество колонок в списке
+    """
+
+    def __init__(
+        self,
+        on_select=None,
+        on_highlight=None,
+        on_load_more=None,
+        height=200,
+        item_height=30,
+        item_spacing=2,
+        bar_width=10,
+        item_cols=1,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.bar_width = bar_width
+        self.scroll_type = ["bars", "content"]
+        self.on_select = on_select
+        self.on_highlight = on_highlight
+        self.on_load_more = on_load_more
+        self.dropdown_height = height
+        self.btn_item_height = item_height
+        self.btn_item_spacing = item_spacing
+        self.item_cols = item_cols
+        self.viewclass = RecycleDropdownItem
+        self.has_more = False
+        self._loading_more = False
+        self._highlighted = None
+
+        # Создаем сетку, в которой RecycleView размещает видимые элементы
+        self.grid = RecycleGridLayout(
+            cols=item_cols,
+            spacing=self.btn_item_spacing,
+            default_size=(None, self.btn_item_height),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+        )
+        self.grid.bind(minimum_height=self.grid.setter("height"))
+        self.add_widget(self.grid)
+        self.bind(scroll_y=self._on_scroll_y)
+        Window.bind(mouse_pos=self._on_mouse_pos)
+
+    def update_items(self, items, has_more=False):
+        """Обновляет элементы списка."""
+        self.has_more = has_more
+        self._loading_more = False
+        if items:
+            self.data = [{"text": item} for item in items]
+            self._update_height()
+            self.scroll_y = 1
+            self.opacity = 1
+        else:
+            self.data = []
+            self.height = 0
+            self.opacity = 0
+
+    def append_items(self, items, has_more=False):
+        """Добавляет в конец списка следующую страницу элементов."""
+        self.has_more = has_more
+        self._loading_more = False
+        if items:
+            self.data.extend({"text": item} for item in items)
+            self._update_height()
+
+    def _update_height(self):
+        """Устанавливает высоту списка по количеству строк, но не больше dropdown_height."""
+        rows = math.ceil(len(self.data) / self.item_cols)
+        height = rows * (self.btn_item_height + self.btn_item_spacing) - self.btn_item_spacing
+        self.height = min(self.dropdown_height, height)
+
+    def _on_scroll_y(self, instance, value):
+        """Запрашивает следующую страницу при прокрутке до конца списка."""
+        if value <= 0 and self.has_more and not self._loading_more and self.on_load_more:
+            self._loading_more = True
+            self.on_load_more()
+
+    def _on_mouse_pos(self, window, pos):
+        """Определяет элемент списка под курсором мыши и сообщает о смене выделенного элемента."""
+        if not self.on_highlight or self.opacity == 0 or not self.collide_point(*self.to_widget(*pos)):
+            self._highlighted = None
+            return
+        for view in self.grid.children:
+            if view.collide_point(*view.to_widget(*pos)):
+                if view.text != self._highlighted:
+                    self._highlighted = view.text
+                    self.on_highlight(view.text)
+                return
+
+    def _on_item_select(self, value):
+        """Обработчик выбора значения из списка."""
+        if self.on_select:
+            self.on_select(value)
+
+
 if __name__ == "__main__":
     from kivy.app import App
     from kivy.uix.floatlayout import FloatLayout
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
+from typing import Optional
+
 from kivy.graphics import Color, Rectangle
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
@@ -27,11 +29,35 @@ class CustomSpinnerOption(SpinnerOption):
 
 
 class LabeledSpinner(BoxLayout):
+    """Выпадающий список с подписью.
+
+    Значение устанавливается по ключу (см. set_value): ключом служит как весь текст пункта, так и номер
+    перед " : " в пунктах вида "<номер> : <описание>". Индекс ключей строится при каждом изменении values.
+
+    Args:
+    label_text - текст подписи
+    values - пункты выпадающего списка
+    substring_fallback - если ключ не найден, искать пункт, содержащий ключ как подстроку (прежнее поведение)
+    """
+
+    KEY_SEPARATOR = " : "
+
     def __init__(
-        self, label_text, values, spinner_text=None, height=65, spacing=5, debug_mode=False, row_height=30, **kwargs
+        self,
+        label_text,
+        values,
+        spinner_text=None,
+        height=65,
+        spacing=5,
+        debug_mode=False,
+        row_height=30,
+        substring_fallback=False,
+        **kwargs,
     ):
         super().__init__(orientation="vertical", size_hint=(1, None), height=height, spacing=spacing, **kwargs)
         self.debug_mode = debug_mode
+        self.substring_fallback = substring_fallback
+        self._index = {}
         # Лейбл
         label = Label(
             text=label_text,
@@ -63,6 +89,8 @@ class LabeledSpinner(BoxLayout):
             )
         )
         self.spinner = spinner
+        spinner.bind(values=self._build_index)
+        self._build_index(spinner, spinner.values)
 
         self.add_widget(self.label)
         self.add_widget(self.spinner)
@@ -90,15 +118,38 @@ class LabeledSpinner(BoxLayout):
         else:
             self.canvas.before.clear()
 
-    def set_value(self, substring):
-        """Устанавливает значение спинера по тексту"""
-        if substring == "" or substring is None:
+    def _build_index(self, instance, values):
+        """Строит индекс: ключ (весь текст пункта или номер перед " : ") -> текст пункта."""
+        index = {}
+        for description in values:
+            key = description.split(self.KEY_SEPARATOR, 1)[0]
+            index.setdefault(key, description)
+        # Полный текст пункта имеет приоритет над совпадающим с ним номером другого пункта
+        index.update((description, description) for description in values)
+        self._index = index
+
+    def set_value(self, key, fallback: Optional[bool] = None):
+        """
+        Устанавливает значение спинера по ключу.
+
+        Args:
+            key: Весь текст пункта или номер перед " : "
+            fallback: Если ключ не найден, искать пункт, содержащий key как подстроку.
+                По умолчанию - как задано в substring_fallback
+        """
+        if key == "" or key is None:
             self.spinner.text = ""
             return True
-        for description in self.spinner.values:
-            if substring in description:
-                self.spinner.text = description
-                return True
+        description = self._index.get(key)
+        if description is not None:
+            self.spinner.text = description
+            return True
+        use_fallback = self.substring_fallback if fallback is None else fallback
+        if use_fallback:
+            for description in self.spinner.values:
+                if key in description:
+                    self.spinner.text = description
+                    return True
         return False
 
     def get_value(self):
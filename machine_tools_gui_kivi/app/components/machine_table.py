@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит виджеты таблицы станков: строки фасетного отбора и отбора по диапазонам,
+строку заголовков с сортировкой и список строк на RecycleView.
+"""
+from kivy.uix.behaviors import ButtonBehavior
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.spinner import Spinner
+from kivy.uix.textinput import TextInput
+
+
+class MachineFacetBar(BoxLayout):
+    """Строка выпадающих списков фасетного отбора. Выбор значения вызывает on_change(facet, value).
+
+    Args:
+    facets - словарь: имя фасета -> заголовок
+    label - функция получения текста значения фасета: label(facet, value)
+    on_change - функция, выполняемая при выборе значения (value = None - отбор по фасету снят)
+    height - высота строки
+    """
+
+    def __init__(self, facets, label=str, on_change=None, height=35, **kwargs):
+        super().__init__(orientation="horizontal", size_hint=(1, None), height=height, spacing=2, **kwargs)
+        self.facets = facets
+        self.label = label
+        self.on_change = on_change
+        self.spinners = {}
+        self._values = {facet: {} for facet in facets}  # Текст пункта списка -> значение фасета
+        self._updating = False
+        for facet, title in facets.items():
+            spinner = Spinner(text=self._all_text(facet), values=[self._all_text(facet)], shorten=True)
+            spinner.bind(text=lambda instance, text, facet=facet: self._on_text(facet, text))
+            self.spinners[facet] = spinner
+            self.add_widget(spinner)
+
+    def set_counts(self, counts, selection):
+        """
+        Обновляет пункты списков: значения фасетов с количеством станков.
+
+        Args:
+            counts - количество станков по значениям фасетов (см. FacetIndex.counts)
+            selection - выбранные значения фасетов
+        """
+        self._updating = True
+        try:
+            for facet, spinner in self.spinners.items():
+                selected = selection.get(facet, ())
+                texts = {}
+                for value, count in sorted(counts.get(facet, {}).items()):
+                    if count or value in selected:
+                        texts[f"{self.label(facet, value)} ({count})"] = value
+                self._values[facet] = texts
+                spinner.values = [self._all_text(facet)] + list(texts)
+                current = [text for text, value in texts.items() if value in selected]
+                spinner.text = current[0] if current else self._all_text(facet)
+        finally:
+            self._updating = False
+
+    def _all_text(self, facet):
+        """Текст пункта, снимающего отбор по фасету."""
+        return f"{self.facets[facet]}: все"
+
+    def _on_text(self, facet, text):
+        """Обработчик выбора пункта списка."""
+        if self._updating or not self.on_change:
+            return
+        self.on_change(facet, self._values[facet].get(text))
+
+
+class MachineRangeBar(BoxLayout):
+    """Строка отбора по названию и диапазонам числовых полей. Изменение текста вызывает on_change().
+
+    Args:
+    fields - словарь: имя поля -> краткий заголовок поля
+    on_change - функция, выполняемая при изменении любого поля ввода
+    height - высота строки
+    """
+
+    def __init__(self, fields, on_change=None, height=35, **kwargs):
+        super().__init__(orientation="horizontal", size_hint=(1, None), height=height, spacing=2, **kwargs)
+        self.on_change = on_change
+        self.name_input = TextInput(hint_text="Название", multiline=False, size_hint=(2, 1))
+        self.name_input.bind(text=self._on_text)
+        self.add_widget(self.name_input)
+        self.inputs = {}
+        for field, title in fields.items():
+            low = TextInput(hint_text=f"{title} от", multiline=False, input_filter="float")
+            high = TextInput(hint_text=f"{title} до", multiline=False, input_filter="float")
+            for text_input in (low, high):
+                text_input.bind(text=self._on_text)
+                self.add_widget(text_input)
+            self.inputs[field] = (low, high)
+
+    def get_name(self):
+        """Возвращает текст отбора по названию."""
+        return self.name_input.text.strip()
+
+    def get_ranges(self):
+        """Возвращает границы диапазонов: имя поля -> (от, до), незаполненная граница - None."""
+        return {field: (self._parse(low.text), self._parse(high.text)) for field, (low, high) in self.inputs.items()}
+
+    @staticmethod
+    def _parse(text):
+        """Преобразует текст границы в число (None, если граница не задана или введена неверно)."""
+        try:
+            return float(text) if text else None
+        except ValueError:
+            return None
+
+    def _on_text(self, instance, value):
+        """Обработчик изменения текста."""
+        if self.on_change:
+            self.on_change()
+
+
+class MachineTableHeader(BoxLayout):
+    """Строка заголовков таблицы. Нажатие на заголовок вызывает on_sort(column).
+
+    Args:
+    columns - словарь: имя столбца -> заголовок
+    on_sort - функция, выполняемая при нажатии на заголовок столбца
+    height - высота строки заголовков
+    """
+
+    def __init__(self, columns, on_sort=None, height=35, **kwargs):
+        super().__init__(orientation="horizontal", size_hint=(1, None), height=height, spacing=2, **kwargs)
+        self.columns = columns
+        self.on_sort = on_sort
+        self.buttons = {}
+        for column, title in columns.items():
+            button = Button(text=title, halign="center", valign="middle")
+            button.bind(size=button.setter("text_size"))
+            button.bind(on_release=lambda instance, column=column: self._on_sort(column))
+            self.buttons[column] = button
+            self.add_widget(button)
+
+    def set_sort(self, column, descending):
+        """Отмечает столбец, по которому отсортирована таблица."""
+        for name, button in self.buttons.items():
+            mark = (" ▼" if descending else " ▲") if name == column else ""
+            button.text = self.columns[name] + mark
+
+    def _on_sort(self, column):
+        """Обработчик нажатия на заголовок столбца."""
+        if self.on_sort:
+            self.on_sort(column)
+
+
+class MachineTableRow(RecycleDataViewBehavior, ButtonBehavior, BoxLayout):
+    """Строка таблицы станков, отображаемая RecycleView (виджеты строк переиспользуются при прокрутке)."""
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="horizontal", spacing=2, **kwargs)
+        self.table_view = None
+        self.machine = None
+        self.labels = []
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Заполняет строку данными станка."""
+        self.table_view = rv
+        self.machine = data["machine"]
+        cells = data["cells"]
+        # Количество ячеек определяется таблицей, поэтому подписи создаются при первом заполнении строки
+        while len(self.labels) < len(cells):
+            label = Label(halign="center", valign="middle", shorten=True)
+            label.bind(size=label.setter("text_size"))
+            self.labels.append(label)
+            self.add_widget(label)
+        for label, text in zip(self.labels, cells):
+            label.text = text
+        return super().refresh_view_attrs(rv, index, {})
+
+    def on_release(self):
+        """Открывает станок строки."""
+        if self.table_view and self.table_view.on_open:
+            self.table_view.on_open(self.machine)
+
+
+class MachineTableView(RecycleView):
+    """Список строк таблицы станков. Создаются только виджеты видимых строк.
+
+    Args:
+    on_open - функция, выполняемая при нажатии на строку: on_open(название станка)
+    row_height - высота строки
+    """
+
+    def __init__(self, on_open=None, row_height=30, **kwargs):
+        super().__init__(**kwargs)
+        self.on_open = on_open
+        self.viewclass = MachineTableRow
+        self.bar_width = 10
+        self.scroll_type = ["bars", "content"]
+
+        self.layout = RecycleBoxLayout(
+            orientation="vertical",
+            spacing=2,
+            default_size=(None, row_height),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+        )
+        self.layout.bind(minimum_height=self.layout.setter("height"))
+        self.add_widget(self.layout)
+
+    def update_rows(self, rows):
+        """Заменяет строки таблицы и прокручивает ее в начало."""
+        self.data = rows
+        self.scroll_y = 1
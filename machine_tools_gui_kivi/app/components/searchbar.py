@@ -33,6 +33,7 @@ class SearchBar(BoxLayout):
         super().__init__(orientation="vertical", **kwargs)
         self.debug_mode = debug_mode
         self.height = height
+        self.input_hint = input_hint
 
         # Горизонтальный контейнер для поля и кнопки
         search_box = BoxLayout(orientation="horizontal", size_hint=(1, None), height=height, spacing=2)
@@ -60,6 +61,10 @@ class SearchBar(BoxLayout):
         self.add_widget(search_box)
         self.bind(pos=self._update_debug_bg, size=self._update_debug_bg)
 
+    def set_loading(self, loading, hint="Загрузка списка станков..."):
+        """Показывает в подсказке поля ввода, что список вариантов еще загружается."""
+        self.input.hint_text = hint if loading else self.input_hint
+
     def _update_debug_bg(self, *args):
         """Обновляет фон поля ввода для отладки"""
         if self.debug_mode:
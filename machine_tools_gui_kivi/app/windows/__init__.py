@@ -2,5 +2,6 @@
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
 from machine_tools_gui_kivi.app.windows.database_editor_window import DatabaseEditorWindow
+from machine_tools_gui_kivi.app.windows.machine_table_window import MachineTableWindow
 
-__all__ = ["DatabaseEditorWindow"]
+__all__ = ["DatabaseEditorWindow", "MachineTableWindow"]
@@ -4,12 +4,13 @@
 """
 Модуль содержит класс окна ввода данных, наследующий от шаблонного окна.
 """
-import copy
-from typing import Optional
+from typing import Dict, Optional
 
+from kivy.clock import Clock, mainthread
 from kivy.core.window import Window
 from kivy.uix.screenmanager import Screen
 from kivymd.app import MDApp
+from kivymd.uix.button import MDIconButton
 from machine_tools import (
     Automation,
     Dimensions,
@@ -18,32 +19,72 @@ from machine_tools import (
     SoftwareControl,
     Specialization,
     WeightClass,
-    info_by_name,
 )
-from machine_tools import update as machine_tool_update
 
 from machine_tools_gui_kivi.app.components.database_editor import TemplateDatabaseEditor
 from machine_tools_gui_kivi.app.components.template_window import TemplateWindow
+from machine_tools_gui_kivi.src.background import LatestTaskRunner
 from machine_tools_gui_kivi.src.descriptions import (
     ACCURACY_DESCRIPTIONS,
     get_accuracy_by_description,
+    get_enum_by_description,
     get_type_fields_descriptions,
 )
-from machine_tools_gui_kivi.src.machine_finder import filter_names
+from machine_tools_gui_kivi.src.edit_state import MachineEditState
+from machine_tools_gui_kivi.src.machine_cache import MACHINE_INFO_CACHE, normalize_name
+from machine_tools_gui_kivi.src.machine_diff import MachineDiff
+from machine_tools_gui_kivi.src.machine_finder import CATALOG, SearchSession, load_info, update_machine
+from machine_tools_gui_kivi.src.prefetch import MachinePrefetcher
+from machine_tools_gui_kivi.src.save_queue import SaveQueue
 
 
 class DatabaseEditorWindow(Screen):
     """Окно ввода данных, обертка для TemplateWindow."""
 
+    SEARCH_DELAY = 0.15  # Задержка поиска после последнего изменения текста, с
+    SEARCH_PAGE_SIZE = 50  # Количество названий на странице выпадающего списка
+    SYNC_INTERVAL = 300  # Интервал синхронизации каталога с базой данных, с
+    PREFETCH_COUNT = 5  # Количество первых результатов поиска, данные которых загружаются заранее
+
+    # Поля MachineInfo и виджеты левой колонки, из которых они заполняются
+    FIELD_WIDGETS = {
+        "group": ("group_spinner",),
+        "type": ("type_spinner",),
+        "machine_type": ("machine_type_input",),
+        "power": ("power_input",),
+        "efficiency": ("efficiency_input",),
+        "accuracy": ("accuracy_spinner",),
+        "automation": ("automation_spinner",),
+        "specialization": ("specialization_spinner",),
+        "weight": ("mass_input",),
+        "weight_class": ("weight_class_spinner",),
+        "dimensions": ("length_input", "width_input", "height_input", "overall_diameter_input"),
+        "location": ("production_city_input", "organization_input"),
+        "software_control": ("software_control_spinner",),
+    }
+
     def __init__(self, screen_manager=None, debug_mode=False, **kwargs):
         super().__init__(**kwargs)
         self.name = "input_window"
         self.model: Optional[str] = None
         self.data_from_database: Optional[MachineInfo] = None  # Старые данные станка (данные из базы данных)
-        self.corrected_data: Optional[MachineInfo] = None  # Новые данные станка (данные для изменений)
+        self.edit_state: Optional[MachineEditState] = None  # Изменения данных станка поверх данных из базы данных
+        self.search_session = SearchSession(CATALOG)  # Сессия поиска для выпадающего списка
+        self._search_query = ""  # Последний введенный текст поиска
+        self._loaded_widget_values = {}  # Значения виджетов сразу после загрузки станка
+        # Сохранения, еще не подтвержденные базой данных: название станка после изменений ->
+        # (данные станка, название и значения виджетов до первого из этих сохранений, накопленные изменения)
+        self._unsaved: Dict[str, tuple] = {}
+        self._failed: Dict[str, MachineDiff] = {}  # Не записанные изменения закрытых станков по названию в БД
+        self._search_runner = LatestTaskRunner(name="machine-search")
+        self._search_trigger = Clock.create_trigger(self._run_search, self.SEARCH_DELAY)
+        self._info_runner = LatestTaskRunner(name="machine-info")
+        self.save_queue = SaveQueue(update_machine, reader=load_info, on_saved=self._on_data_saved)
+        self._prefetcher = MachinePrefetcher(MACHINE_INFO_CACHE, load_info, maxsize=self.PREFETCH_COUNT + 1)
 
         # Создаем шаблонное окно
         self.template_window = TemplateWindow(screen_manager=screen_manager, debug_mode=debug_mode)
+        self._title = self.template_window.label.text
 
         # Добавляем контент
         self.content_widget = TemplateDatabaseEditor(
@@ -59,16 +100,53 @@ class DatabaseEditorWindow(Screen):
         self.content_widget.left_col.search_bar.button.bind(on_release=self.on_search_machine)
         self.content_widget.left_col.search_bar.input.bind(text=self.on_search_input_changed)
         self.content_widget.left_col.search_bar_dropdown.on_select = self.on_dropdown_select
+        self.content_widget.left_col.search_bar_dropdown.on_load_more = self.on_dropdown_load_more
+        self.content_widget.left_col.search_bar_dropdown.on_highlight = self.on_dropdown_highlight
 
         # Переопределяем имя и функцию кнопок
         self.template_window.button1.text = "Сохранить"
         self.template_window.button1.bind(on_release=self.on_release_save_button)
+        self.template_window.button1.disabled = CATALOG.read_only
 
         self.template_window.button2.text = "Отмена"
         self.template_window.button2.bind(on_release=self.cancel)
 
+        # Кнопка перехода к таблице станков
+        self.table_btn = MDIconButton(
+            icon="table",
+            size_hint=(None, None),
+            size=(40, 40),
+            padding=0,
+            on_release=self.open_table,
+        )
+        self.template_window.header.add_widget(self.table_btn)
+
         self.clear_widgets()
 
+        # Загружаем каталог станков в фоне после отрисовки первого кадра
+        CATALOG.add_listener(self._on_catalog_state_change)
+        self._on_catalog_state_change(CATALOG.state)
+        Clock.schedule_once(lambda dt: CATALOG.load_async(), 0)
+        # Периодически подтягиваем изменения, внесенные другими пользователями
+        CATALOG.start_sync(self.SYNC_INTERVAL)
+
+    @mainthread
+    def _on_catalog_state_change(self, state):
+        """
+        Обработчик изменения состояния каталога станков.
+
+        Args:
+            state: Состояние каталога (см. MachineCatalog)
+        """
+        searchbar = self.content_widget.left_col.search_bar
+        if state == CATALOG.ERROR:
+            searchbar.set_loading(True, hint="Список станков не загружен")
+            return
+        searchbar.set_loading(state != CATALOG.READY)
+        # Обновляем только список вариантов для уже введенного текста: форму редактируемого станка не трогаем
+        if state == CATALOG.READY and self._search_query:
+            self._search_trigger()
+
     def _on_technical_requirements_change(self, property_name, value):
         """
         Обработчик изменения технических требований.
@@ -77,9 +155,11 @@ class DatabaseEditorWindow(Screen):
             property_name: Название свойства
             value: Новое значение
         """
-        if self.corrected_data and self.corrected_data.technical_requirements is not None:
-            if self.corrected_data.technical_requirements.get(property_name) != value:
-                self.corrected_data.technical_requirements[property_name] = value
+        if self.edit_state:
+            current = self.edit_state.get_requirement(property_name)
+            # Значения в таблице - строки, поэтому совпадение строкового представления изменением не считается
+            if current != value and (current is None or str(current) != value):
+                self.edit_state.set_requirement(property_name, value)
                 print(f"Обновлено техническое требование: {property_name} = {value}")
 
     def _on_technical_requirement_name_change(self, old_name, new_name):
@@ -90,17 +170,9 @@ class DatabaseEditorWindow(Screen):
             old_name: Старое название требования
             new_name: Новое название требования
         """
-        if self.corrected_data and self.corrected_data.technical_requirements is not None:
-            if old_name in self.corrected_data.technical_requirements:
-                # Создаем новый словарь с сохранением порядка
-                new_requirements = {}
-                for key, value in self.corrected_data.technical_requirements.items():
-                    if key == old_name:
-                        new_requirements[new_name] = value
-                    else:
-                        new_requirements[key] = value
-                self.corrected_data.technical_requirements = new_requirements
-                print(f"Переименовано техническое требование: {old_name} -> {new_name}")
+        if self.edit_state and self.edit_state.has_requirement(old_name):
+            self.edit_state.rename_requirement(old_name, new_name)
+            print(f"Переименовано техническое требование: {old_name} -> {new_name}")
 
     def on_search_machine(self, instance):
         """Обрабатывает событие нажатия на кнопку поиска."""
@@ -108,70 +180,206 @@ class DatabaseEditorWindow(Screen):
         text = self.content_widget.left_col.search_bar.input.text
         if text:
             # Удаляем все пробелы и преобразуем в верхний регистр
-            self.model = text.upper().replace(" ", "")
+            self.model = normalize_name(text)
             # Получаем данные из базы данных
             self.get_info()
         else:
             print("Не введено название станка")
 
+    def open_machine(self, name: str):
+        """Загружает в редактор станок name (например, выбранный в таблице станков)."""
+        self.content_widget.left_col.search_bar.input.text = name
+        self.content_widget.left_col.search_bar_dropdown.opacity = 0
+        self.model = normalize_name(name)
+        self.get_info()
+
+    def open_table(self, instance):
+        """Переходит к таблице станков."""
+        if self.manager is not None and self.manager.has_screen("machine_table"):
+            self.manager.current = "machine_table"
+
     def get_info(self):
-        """Получаем данные из базы данных"""
-        info = info_by_name(self.model)
+        """
+        Получаем данные станка из кэша, из хранилища каталога или из базы данных.
+
+        Кэш заполняется только данными, прочитанными из базы данных, поэтому в течение времени жизни записи кэша
+        они отображаются без обращения к базе данных. Данные хранилища каталога (загруженные при запуске)
+        отображаются сразу, но перечитываются из базы данных в фоне: если станок изменили другие пользователи,
+        а в редакторе еще нет изменений, отображаются новые данные (см. _on_info_revalidated).
+        Без данных в хранилище запрос к базе данных выполняется в фоновом потоке, на время загрузки колонки
+        редактора блокируются. Результат загрузки станка, который уже не выбран, игнорируется.
+        """
+        model = self.model
+        info = MACHINE_INFO_CACHE.get(model)
+        if info:
+            self._info_runner.cancel()
+            self._on_info_loaded(model, info)
+            return
+        stored = CATALOG.store.get(model) if CATALOG.store is not None else None
+        if stored:
+            self._on_info_loaded(model, stored)
+        else:
+            self._set_loading(True)
+        self._info_runner.submit(
+            MACHINE_INFO_CACHE.get_or_load,
+            model,
+            load_info,
+            callback=lambda info: (
+                self._on_info_revalidated(model, stored, info) if stored else self._on_info_loaded(model, info)
+            ),
+            error_callback=lambda error: self._on_info_error(model, error),
+        )
+
+    @mainthread
+    def _on_info_loaded(self, model, info):
+        """
+        Отображает загруженные данные станка.
+
+        Args:
+            model: Название станка, для которого выполнялась загрузка
+            info: Данные станка или None, если станок не найден
+        """
+        if model != self.model:
+            return
+        self._set_loading(False)
         if info:
+            CATALOG.watch(info.name)
             self.data_from_database = info
-            self.corrected_data = copy.deepcopy(info)
+            self.edit_state = MachineEditState(info)
             self.set_widget_data(info)
             print(f"Выбран станок модели: {self.model}")
+            failed = self._failed.pop(self.model, None)
+            if failed:
+                self._restore_edits(failed)
         else:
             print(f"Станок модели {self.model} не найден в базе данных.")
 
+    @mainthread
+    def _on_info_revalidated(self, model, stored, info):
+        """
+        Сверяет отображаемые данные хранилища с данными, прочитанными из базы данных.
+
+        Args:
+            model: Название станка, для которого выполнялась загрузка
+            stored: Данные станка из хранилища, отображенные при открытии
+            info: Данные станка из базы данных или None, если станок не найден
+        """
+        if model != self.model or not info or info == stored or self.data_from_database is not stored:
+            return
+        edited = bool(self.edit_state.diff()) or self._read_widget_values() != self._loaded_widget_values
+        if edited or model in self._unsaved:
+            # Изменения пользователя не сбрасываем: при сохранении они применяются к данным из базы данных
+            self._show_status(f"Станок {info.name} изменен в базе данных другим пользователем")
+            return
+        print(f"Данные станка {info.name} обновлены из базы данных.")
+        self._on_info_loaded(model, info)
+
+    @mainthread
+    def _on_info_error(self, model, error):
+        """Обрабатывает ошибку загрузки данных станка."""
+        if model != self.model:
+            return
+        self._set_loading(False)
+        print(f"Ошибка загрузки станка модели {model}: {error}")
+
+    def _set_loading(self, loading: bool):
+        """Переключает колонки редактора в состояние загрузки."""
+        self.content_widget.left_col.set_loading(loading)
+        self.content_widget.right_col.set_loading(loading)
+
     def on_search_input_changed(self, instance, value: str):
-        """Обрабатывает событие изменения текста в поле ввода."""
-        print(value)
+        """
+        Обрабатывает событие изменения текста в поле ввода.
+
+        Поиск выполняется с задержкой после последнего изменения текста и в фоновом потоке,
+        в выпадающий список попадает только результат для актуального текста.
+        """
         if value != self.model:
+            # Текст изменился - загрузка ранее выбранного станка больше не нужна
+            self._info_runner.cancel()
+            self._set_loading(False)
             self.clear_widgets()
-        value = value.upper()
+        self._search_query = value.upper()
+        if len(self._search_query) > 0:
+            self._search_trigger()
+        else:
+            self._search_trigger.cancel()
+            self._search_runner.cancel()
+            self._prefetcher.clear()
+            self.content_widget.left_col.search_bar_dropdown.opacity = 0
+
+    def _run_search(self, dt):
+        """Запускает поиск по последнему введенному тексту в фоновом потоке."""
+        query = self._search_query
+        self._search_runner.submit(
+            self._search_first_page,
+            query,
+            callback=lambda page: self._on_search_results(query, *page),
+        )
+
+    def _search_first_page(self, query):
+        """Возвращает первую страницу результата поиска и признак наличия следующей (выполняется в фоне)."""
+        filtered = self.search_session.search(query, self.SEARCH_PAGE_SIZE)
+        return filtered, self.search_session.has_more
+
+    def _search_next_page(self):
+        """Возвращает следующую страницу результата поиска и признак наличия следующей (выполняется в фоне)."""
+        filtered = self.search_session.more(self.SEARCH_PAGE_SIZE)
+        return filtered, self.search_session.has_more
+
+    def on_dropdown_load_more(self):
+        """Загружает следующую страницу результата поиска при прокрутке выпадающего списка до конца."""
+        query = self._search_query
+        self._search_runner.submit(
+            self._search_next_page,
+            callback=lambda page: self._on_search_more_results(query, *page),
+        )
+
+    @mainthread
+    def _on_search_more_results(self, query, filtered, has_more):
+        """Добавляет следующую страницу результата поиска в выпадающий список."""
+        if query == self._search_query:
+            self.content_widget.left_col.search_bar_dropdown.append_items(filtered, has_more)
+
+    @mainthread
+    def _on_search_results(self, query, filtered, has_more):
+        """
+        Отображает результат поиска в выпадающем списке.
+
+        Args:
+            query: Текст, по которому выполнялся поиск
+            filtered: Первая страница найденных названий станков
+            has_more: Есть ли следующая страница
+        """
+        if query != self._search_query:
+            return
         searchbar = self.content_widget.left_col.search_bar
         dropdown = self.content_widget.left_col.search_bar_dropdown
-        if len(value) > 0:
-            filtered = filter_names(value)
-            dropdown.update_items(filtered)
-            # Показываем список только если есть варианты и поле в фокусе
-            if filtered and searchbar.input.focus:
-                dropdown.opacity = 1
-                # Позиционируем dropdown под searchbar
-                dropdown.width = searchbar.input.width
-                dropdown.x = searchbar.input.to_window(searchbar.input.x, searchbar.input.y)[0]
-                dropdown.y = searchbar.input.to_window(searchbar.input.x, searchbar.input.y)[1] - dropdown.height
-            else:
-                dropdown.opacity = 0
+        dropdown.update_items(filtered, has_more)
+        # Заранее загружаем в кэш данные первых найденных станков
+        self._prefetcher.prefetch(filtered[: self.PREFETCH_COUNT])
+        # Показываем список только если есть варианты и поле в фокусе
+        if filtered and searchbar.input.focus:
+            dropdown.opacity = 1
+            # Позиционируем dropdown под searchbar
+            dropdown.width = searchbar.input.width
+            dropdown.x = searchbar.input.to_window(searchbar.input.x, searchbar.input.y)[0]
+            dropdown.y = searchbar.input.to_window(searchbar.input.x, searchbar.input.y)[1] - dropdown.height
         else:
             dropdown.opacity = 0
 
+    def on_dropdown_highlight(self, value):
+        """Загружает заранее данные станка, на который наведен курсор в выпадающем списке."""
+        self._prefetcher.prefetch_first(value)
+
     def on_dropdown_select(self, value):
         """Обрабатывает событие выбора станка из списка."""
         self.content_widget.left_col.search_bar.input.text = value
         self.content_widget.left_col.search_bar_dropdown.opacity = 0
 
     def clear_widgets(self):
-        """Очищает все виджеты."""
-        self.content_widget.left_col.group_spinner.clear_value()
-        self.content_widget.left_col.type_spinner.clear_value()
-        self.content_widget.left_col.machine_type_input.clear_value()
-        self.content_widget.left_col.power_input.clear_value()
-        self.content_widget.left_col.efficiency_input.clear_value()
-        self.content_widget.left_col.accuracy_spinner.clear_value()
-        self.content_widget.left_col.automation_spinner.clear_value()
-        self.content_widget.left_col.specialization_spinner.clear_value()
-        self.content_widget.left_col.mass_input.clear_value()
-        self.content_widget.left_col.weight_class_spinner.clear_value()
-        self.content_widget.left_col.production_city_input.clear_value()
-        self.content_widget.left_col.organization_input.clear_value()
-        self.content_widget.left_col.length_input.clear_value()
-        self.content_widget.left_col.width_input.clear_value()
-        self.content_widget.left_col.height_input.clear_value()
-        self.content_widget.left_col.overall_diameter_input.clear_value()
-        self.content_widget.left_col.software_control_spinner.clear_value()
+        """Очищает все виджеты (если форма уже пуста, виджеты не затрагиваются)."""
+        self.content_widget.left_col.clear_form()
 
     def set_widget_data(self, data: MachineInfo):
         """Устанавливает данные в виджеты."""
@@ -179,87 +387,221 @@ class DatabaseEditorWindow(Screen):
             #  получаем список типов станков для выпадающего списка по группе выбранного станка
             str_group = str(int(data.group))
             type_fields = get_type_fields_descriptions(str_group)
-            #  устанавливаем список типов станков для выпадающего списка типа станка
-            self.content_widget.left_col.type_spinner.spinner.values = type_fields
-            #  устанавливаем значения для полей по данным из базы данных
-            self.content_widget.left_col.group_spinner.set_value(str_group)
-            self.content_widget.left_col.type_spinner.set_value(str(int(data.type)))
-            self.content_widget.left_col.machine_type_input.set_value(str(data.machine_type))
-            self.content_widget.left_col.power_input.set_value(str(data.power))
-            self.content_widget.left_col.efficiency_input.set_value(str(data.efficiency))
-            self.content_widget.left_col.accuracy_spinner.set_value(ACCURACY_DESCRIPTIONS[data.accuracy.value])
-            self.content_widget.left_col.automation_spinner.set_value(data.automation.value)
-            self.content_widget.left_col.specialization_spinner.set_value(data.specialization.value)
-            self.content_widget.left_col.mass_input.set_value(str(data.weight))
-            self.content_widget.left_col.weight_class_spinner.set_value(data.weight_class.value)
-            self.content_widget.left_col.production_city_input.set_value(data.location.city)
-            self.content_widget.left_col.organization_input.set_value(data.location.manufacturer)
-            self.content_widget.left_col.length_input.set_value(str(data.dimensions.length))
-            self.content_widget.left_col.width_input.set_value(str(data.dimensions.width))
-            self.content_widget.left_col.height_input.set_value(str(data.dimensions.height))
-            self.content_widget.left_col.overall_diameter_input.set_value(str(data.dimensions.overall_diameter))
+            #  устанавливаем список типов станков и значения для полей по данным из базы данных за один проход
+            self.content_widget.left_col.apply_form_state(
+                {
+                    "group_spinner": str_group,
+                    "type_spinner": str(int(data.type)),
+                    "machine_type_input": str(data.machine_type),
+                    "power_input": str(data.power),
+                    "efficiency_input": str(data.efficiency),
+                    "accuracy_spinner": ACCURACY_DESCRIPTIONS[data.accuracy.value],
+                    "automation_spinner": data.automation.value,
+                    "specialization_spinner": data.specialization.value,
+                    "mass_input": str(data.weight),
+                    "weight_class_spinner": data.weight_class.value,
+                    "production_city_input": data.location.city,
+                    "organization_input": data.location.manufacturer,
+                    "length_input": str(data.dimensions.length),
+                    "width_input": str(data.dimensions.width),
+                    "height_input": str(data.dimensions.height),
+                    "overall_diameter_input": str(data.dimensions.overall_diameter),
+                    "software_control_spinner": data.software_control.value,
+                },
+                type_values=type_fields,
+            )
             self.content_widget.right_col.update_properties(data.technical_requirements)
-            self.content_widget.left_col.software_control_spinner.set_value(data.software_control.value)
+            self._loaded_widget_values = self._read_widget_values()
+
+    def _read_widget_values(self) -> dict:
+        """Возвращает текущие значения виджетов левой колонки, из которых заполняются поля MachineInfo."""
+        left_col = self.content_widget.left_col
+        return {
+            widget_name: getattr(left_col, widget_name).get_value()
+            for widget_names in self.FIELD_WIDGETS.values()
+            for widget_name in widget_names
+        }
+
+    def _parse_field(self, field: str, values: dict):
+        """
+        Возвращает значение поля MachineInfo, полученное из значений виджетов.
+
+        Args:
+            field: Название поля MachineInfo
+            values: Значения виджетов (см. _read_widget_values)
+        """
+        if field == "group":
+            return int(values["group_spinner"].split(" ")[0])
+        if field == "type":
+            return int(values["type_spinner"].split(" ")[0])
+        if field == "machine_type":
+            return values["machine_type_input"]
+        if field == "power":
+            return float(values["power_input"])
+        if field == "efficiency":
+            return float(values["efficiency_input"])
+        if field == "accuracy":
+            return get_accuracy_by_description(values["accuracy_spinner"])
+        if field == "automation":
+            return get_enum_by_description(Automation, values["automation_spinner"])
+        if field == "specialization":
+            return get_enum_by_description(Specialization, values["specialization_spinner"])
+        if field == "weight":
+            return float(values["mass_input"])
+        if field == "weight_class":
+            return get_enum_by_description(WeightClass, values["weight_class_spinner"])
+        if field == "dimensions":
+            return Dimensions(
+                length=int(float(values["length_input"])),
+                width=int(float(values["width_input"])),
+                height=int(float(values["height_input"])),
+                overall_diameter=values["overall_diameter_input"],
+            )
+        if field == "location":
+            return Location(city=values["production_city_input"], manufacturer=values["organization_input"])
+        if field == "software_control":
+            return get_enum_by_description(SoftwareControl, values["software_control_spinner"])
+        raise ValueError(f"Неизвестное поле MachineInfo: {field}")
 
     def get_data_from_widgets(self):
         """
-        Получает данные из виджетов и сохраняет их в объект MachineInfo.
+        Получает данные из виджетов и сохраняет их в состояние редактирования станка.
+        Разбираются только поля, значения виджетов которых изменились после загрузки станка.
         ВАЖНО! Объект MachineInfo - объект pydantic.BaseModel, поэтому данные обновляются, но не валидируются
         """
-        self.corrected_data.name = self.content_widget.left_col.search_bar.input.text
-        self.corrected_data.group = int(self.content_widget.left_col.group_spinner.get_value().split(" ")[0])
-        self.corrected_data.type = int(self.content_widget.left_col.type_spinner.get_value().split(" ")[0])
-        self.corrected_data.power = float(self.content_widget.left_col.power_input.get_value())
-        self.corrected_data.efficiency = float(self.content_widget.left_col.efficiency_input.get_value())
-        self.corrected_data.accuracy = get_accuracy_by_description(
-            self.content_widget.left_col.accuracy_spinner.get_value()
-        )
-        self.corrected_data.automation = Automation(self.content_widget.left_col.automation_spinner.get_value())
-        self.corrected_data.specialization = Specialization(
-            self.content_widget.left_col.specialization_spinner.get_value(),
-        )
-        self.corrected_data.weight = float(self.content_widget.left_col.mass_input.get_value())
-        self.corrected_data.weight_class = WeightClass(self.content_widget.left_col.weight_class_spinner.get_value())
-        self.corrected_data.dimensions = Dimensions(
-            length=int(float(self.content_widget.left_col.length_input.get_value())),
-            width=int(float(self.content_widget.left_col.width_input.get_value())),
-            height=int(float(self.content_widget.left_col.height_input.get_value())),
-            overall_diameter=self.content_widget.left_col.overall_diameter_input.get_value(),
-        )
-        self.corrected_data.location = Location(
-            city=self.content_widget.left_col.production_city_input.get_value(),
-            manufacturer=self.content_widget.left_col.organization_input.get_value(),
-        )
-        self.corrected_data.machine_type = self.content_widget.left_col.machine_type_input.get_value()
-        self.corrected_data.software_control = SoftwareControl(
-            self.content_widget.left_col.software_control_spinner.get_value(),
-        )
+        self.edit_state.set("name", self.content_widget.left_col.search_bar.input.text)
+        values = self._read_widget_values()
+        changed = {name for name, value in values.items() if self._loaded_widget_values.get(name) != value}
+        for field, widget_names in self.FIELD_WIDGETS.items():
+            if changed.intersection(widget_names):
+                self.edit_state.set(field, self._parse_field(field, values))
 
     def on_release_save_button(self, instance):
         """Обрабатывает событие нажатия на кнопку сохранения."""
-        if not self.corrected_data:
+        if CATALOG.read_only:
+            print("Автономный режим: сохранение изменений недоступно")
+            return
+        if not self.edit_state:
             print("Данные не найдены")
             return
-        if not isinstance(self.corrected_data, MachineInfo):
+        if not isinstance(self.edit_state.base, MachineInfo):
             print("Данные не являются объектом MachineInfo")
             return
         self.get_data_from_widgets()
-        if self.corrected_data != self.data_from_database:
-            self.save_data(self.corrected_data)
+        diff = self.edit_state.diff()
+        if diff:
+            self.save_data(diff)
         else:
             print("Измененных данных не найдено.")
 
-    def save_data(self, data: MachineInfo):
-        """Сохраняет данные в базу данных."""
-        print(f"Данные из базы данных: {self.data_from_database}")
-        print(f"Скорректированные данные: {self.corrected_data}")
-        print(f"Обновляем данные в БД...")
-        result = machine_tool_update(data)
+    def save_data(self, diff: MachineDiff):
+        """
+        Ставит изменения станка в очередь сохранения в базу данных.
+
+        В очередь ставятся только измененные поля (MachineDiff). Перед записью очередь перечитывает станок из базы
+        данных и применяет изменения к прочитанным данным, и в базу данных передается полная запись станка
+        (machine_tools.update принимает MachineInfo целиком), поэтому поля, измененные другими пользователями,
+        не перезаписываются. Последняя известная версия станка (из кэша, хранилища каталога или редактора)
+        используется, только если перечитать станок не удалось.
+        Запись выполняется пакетом в фоновом потоке (см. SaveQueue), после записи кэш и каталог обновляются
+        записанными данными без повторного чтения из базы данных.
+
+        Редактор сразу продолжает работу от сохраненных данных, но до подтверждения записи помнит данные станка
+        до сохранения и накопленные изменения: если запись не удалась, изменения возвращаются в редактор
+        (см. _on_save_failed).
+        """
+        print(f"Изменения станка {self.model}: {diff}")
+        print("Ставим данные в очередь записи в БД...")
+        unsaved = self._unsaved.pop(self.model, None)
+        if unsaved is None:
+            base = MACHINE_INFO_CACHE.get(self.model)
+            if base is None and CATALOG.store is not None:
+                base = CATALOG.store.get(self.model)
+            unsaved = (self.data_from_database, self.model, self._loaded_widget_values, MachineDiff())
+        else:
+            # Предыдущее сохранение еще не подтверждено: хранилище и кэш содержат данные без его изменений
+            base = self.data_from_database
+        # Название станка в базе данных (self.model - нормализованное название, в каталоге его может не быть)
+        self.save_queue.enqueue(self.data_from_database.name, base or self.data_from_database, diff)
+        self.data_from_database = self.edit_state.materialize()
+        self.edit_state = MachineEditState(self.data_from_database)
+        self._loaded_widget_values = self._read_widget_values()
+        self.model = normalize_name(self.data_from_database.name)
+        original, model, loaded_widget_values, unsaved_diff = unsaved
+        self._unsaved[self.model] = (original, model, loaded_widget_values, unsaved_diff.merge(diff))
+
+    def _on_data_saved(self, old_name: str, info: MachineInfo, result: bool):
+        """
+        Обработчик записи данных станка в базу данных (вызывается из потока очереди сохранения).
+
+        Args:
+            old_name: Название станка до изменения
+            info: Записанные данные станка
+            result: Результат записи
+        """
         if result:
-            print("Данные успешно обновлены в базе данных.")
+            CATALOG.apply_saved(old_name, info)
+            print(f"Данные станка {info.name} успешно обновлены в базе данных.")
+            self._on_save_confirmed(info.name)
         else:
-            print("Ошибка при обновлении данных в базе данных.")
-        self.get_info()
+            # Сбрасываем локальные данные, чтобы при следующей загрузке прочитать станок из базы данных
+            MACHINE_INFO_CACHE.invalidate(old_name)
+            if CATALOG.store is not None:
+                CATALOG.store.remove(old_name)
+            print(f"Ошибка при обновлении данных станка {info.name} в базе данных.")
+            self._on_save_failed(info.name)
+
+    @mainthread
+    def _on_save_confirmed(self, name: str):
+        """Забывает данные станка до сохранения после подтверждения записи (если нет новых сохранений станка)."""
+        key = normalize_name(name)
+        if not self.save_queue.is_pending(key):
+            self._unsaved.pop(key, None)
+        self._show_status()
+
+    @mainthread
+    def _on_save_failed(self, name: str):
+        """
+        Возвращает в редактор изменения, которые не удалось записать в базу данных, и сообщает об ошибке.
+
+        Если станок открыт, редактор возвращается к данным до сохранения, а не записанные изменения и правки,
+        сделанные после сохранения, снова становятся изменениями. Изменения закрытого станка восстанавливаются
+        при следующем открытии станка.
+
+        Args:
+            name: Название станка после изменений
+        """
+        self._show_status(f"Ошибка сохранения станка {name}: изменения не записаны")
+        key = normalize_name(name)
+        if self.save_queue.is_pending(key):
+            # В очереди есть следующее сохранение станка: оно запишет и эти изменения
+            return
+        unsaved = self._unsaved.pop(key, None)
+        if unsaved is None:
+            return
+        original, model, loaded_widget_values, unsaved_diff = unsaved
+        if key != self.model or self.edit_state is None:
+            self._failed[model] = unsaved_diff
+            return
+        # Правки в полях левой колонки определяются по значениям виджетов до сохранения
+        diff = unsaved_diff.merge(self.edit_state.diff())
+        self.data_from_database = original
+        self.edit_state = MachineEditState(original)
+        self.edit_state.apply(diff)
+        self._loaded_widget_values = loaded_widget_values
+        self.model = model
+
+    def _restore_edits(self, diff: MachineDiff):
+        """Отображает не записанные изменения diff поверх только что загруженного станка."""
+        loaded_widget_values = self._loaded_widget_values
+        self.edit_state.apply(diff)
+        self.set_widget_data(self.edit_state.materialize())
+        self._loaded_widget_values = loaded_widget_values
+        self._show_status(f"Восстановлены не записанные изменения станка {self.data_from_database.name}")
+
+    def _show_status(self, message: Optional[str] = None):
+        """Показывает сообщение в заголовке окна (без сообщения - восстанавливает заголовок)."""
+        self.template_window.label.text = message or self._title
 
     @staticmethod
     def cancel(instance):
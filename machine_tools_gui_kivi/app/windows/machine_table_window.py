@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит окно просмотра списка станков в виде таблицы.
+"""
+from kivy.clock import Clock, mainthread
+from kivy.uix.button import Button
+from kivy.uix.screenmanager import Screen
+
+from machine_tools_gui_kivi.app.components.machine_table import (
+    MachineFacetBar,
+    MachineRangeBar,
+    MachineTableHeader,
+    MachineTableView,
+)
+from machine_tools_gui_kivi.app.components.template_window import TemplateWindow
+from machine_tools_gui_kivi.src.facets import facet_label
+from machine_tools_gui_kivi.src.machine_finder import CATALOG
+from machine_tools_gui_kivi.src.machine_table import TABLE_COLUMNS, MachineTable
+
+
+class MachineTableWindow(Screen):
+    """
+    Окно просмотра станков таблицей с постраничным выводом, сортировкой по столбцам, фасетным отбором
+    и отбором по названию и диапазонам числовых полей.
+
+    Данные берутся из хранилища каталога (см. machine_finder.CATALOG), нажатие на строку открывает станок
+    в окне редактора (см. DatabaseEditorWindow.open_machine).
+    """
+
+    PAGE_SIZE = 200  # Количество станков на странице таблицы
+    FILTER_DELAY = 0.3  # Задержка применения отбора после последнего изменения текста, с
+    TITLE = "Список станков"
+
+    # Фасеты, по которым доступен отбор: имя фасета (см. facets.FACETS) -> заголовок
+    FACET_TITLES = {
+        "group": "Группа",
+        "type": "Тип",
+        "accuracy": "Точность",
+        "automation": "Автоматизация",
+        "specialization": "Специализация",
+        "weight_class": "Класс по массе",
+        "software_control": "ЧПУ",
+    }
+
+    # Числовые поля, по которым доступен отбор по диапазону: имя поля (см. range_index.RANGE_FIELDS) -> заголовок
+    RANGE_TITLES = {
+        "power": "P, кВт",
+        "weight": "m, кг",
+        "length": "L, мм",
+        "width": "B, мм",
+        "height": "H, мм",
+    }
+
+    def __init__(self, screen_manager=None, debug_mode=False, **kwargs):
+        super().__init__(**kwargs)
+        self.name = "machine_table"
+        self.screen_manager = screen_manager
+        self.table = MachineTable(CATALOG.store, page_size=self.PAGE_SIZE, matcher=self.match_names)
+        self.page_number = 0
+        self._filter_trigger = Clock.create_trigger(self._apply_filter, self.FILTER_DELAY)
+
+        # Создаем шаблонное окно
+        self.template_window = TemplateWindow(screen_manager=screen_manager, debug_mode=debug_mode)
+        self.template_window.label.text = self.TITLE
+
+        # Добавляем контент
+        self.facet_bar = MachineFacetBar(self.FACET_TITLES, label=facet_label, on_change=self.on_facet_change)
+        self.range_bar = MachineRangeBar(self.RANGE_TITLES, on_change=self._filter_trigger)
+        self.header = MachineTableHeader(TABLE_COLUMNS, on_sort=self.on_sort)
+        self.table_view = MachineTableView(on_open=self.on_open_machine)
+        self.template_window.content.add_widget(self.facet_bar)
+        self.template_window.content.add_widget(self.range_bar)
+        self.template_window.content.add_widget(self.header)
+        self.template_window.content.add_widget(self.table_view)
+        self.add_widget(self.template_window)
+
+        # Переопределяем имя и функцию кнопок
+        self.template_window.button1.text = "Назад"
+        self.template_window.button1.bind(on_release=self.on_previous_page)
+        self.template_window.button2.text = "Вперед"
+        self.template_window.button2.bind(on_release=self.on_next_page)
+        self.editor_button = Button(
+            text="Редактор",
+            size_hint=(None, 1),
+            width=self.template_window.max_button_width,
+            on_release=self.open_editor,
+        )
+        self.template_window.buttons_box.add_widget(self.editor_button)
+
+        self.header.set_sort(self.table.sort_column, self.table.descending)
+        CATALOG.add_listener(self._on_catalog_state_change)
+
+    @staticmethod
+    def match_names(query):
+        """
+        Возвращает названия станков для отбора по названию так же, как поиск в окне редактора:
+        запрос приводится к верхнему регистру, а если по подстроке ничего не найдено - выполняется нечеткий поиск.
+        """
+        query = query.upper()
+        return CATALOG.matches(query) or CATALOG.fuzzy(query)
+
+    def on_pre_enter(self, *args):
+        """Обновляет таблицу перед показом окна (данные хранилища могли измениться)."""
+        self.refresh()
+
+    @mainthread
+    def _on_catalog_state_change(self, state):
+        """Обновляет таблицу при изменении каталога, если окно открыто."""
+        if self.manager is not None and self.manager.current == self.name:
+            self.refresh()
+
+    def refresh(self):
+        """Отображает текущую страницу таблицы."""
+        self.page_number = min(self.page_number, self.table.page_count - 1)
+        self.table_view.update_rows(self.table.rows(self.page_number))
+        self.template_window.button1.disabled = self.page_number == 0
+        self.template_window.button2.disabled = self.page_number >= self.table.page_count - 1
+        self.facet_bar.set_counts(self.table.facet_counts(), self.table.selection)
+        title = f"{self.TITLE}: страница {self.page_number + 1} из {self.table.page_count}"
+        self.template_window.label.text = f"{title} (станков: {self.table.total})"
+
+    def on_sort(self, column):
+        """Сортирует таблицу по столбцу column (повторное нажатие меняет направление сортировки)."""
+        self.table.sort(column)
+        self.header.set_sort(self.table.sort_column, self.table.descending)
+        self.page_number = 0
+        self.refresh()
+
+    def on_facet_change(self, facet, value):
+        """Устанавливает отбор по фасету facet (value = None снимает отбор)."""
+        self.table.select(facet, () if value is None else (value,))
+        self.page_number = 0
+        self.refresh()
+
+    def _apply_filter(self, dt=None):
+        """Устанавливает отбор по названию и диапазонам из строки отбора."""
+        self.table.set_name_query(self.range_bar.get_name())
+        for field, (low, high) in self.range_bar.get_ranges().items():
+            self.table.set_range(field, low, high)
+        self.page_number = 0
+        self.refresh()
+
+    def on_previous_page(self, instance):
+        """Показывает предыдущую страницу."""
+        if self.page_number > 0:
+            self.page_number -= 1
+            self.refresh()
+
+    def on_next_page(self, instance):
+        """Показывает следующую страницу."""
+        if self.page_number < self.table.page_count - 1:
+            self.page_number += 1
+            self.refresh()
+
+    def on_open_machine(self, machine):
+        """Открывает станок в окне редактора."""
+        editor = self.screen_manager.get_screen("input_window")
+        self.screen_manager.current = editor.name
+        editor.open_machine(machine)
+
+    def open_editor(self, instance):
+        """Переходит в окно редактора."""
+        self.screen_manager.current = "input_window"
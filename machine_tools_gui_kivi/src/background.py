@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит средства выполнения задач в фоновых потоках.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+
+class LatestTaskRunner:
+    """
+    Выполняет задачи в одном фоновом потоке, оставляя актуальной только последнюю.
+
+    Каждая новая задача делает устаревшими все ранее поставленные: устаревшая задача, не успевшая начаться,
+    пропускается, а результат устаревшей задачи, которая уже выполнялась, не передается в callback.
+
+    ВАЖНО! callback и error_callback вызываются из фонового потока.
+
+    Args:
+        name (str): Префикс имени фонового потока
+    """
+
+    def __init__(self, name: str = "latest-task"):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def submit(
+        self,
+        func: Callable,
+        *args,
+        callback: Optional[Callable] = None,
+        error_callback: Optional[Callable[[Exception], None]] = None,
+    ) -> int:
+        """
+        Ставит задачу func(*args) в очередь, делая устаревшими предыдущие задачи.
+
+        Returns:
+            int: Номер задачи (см. is_current)
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+
+        def run():
+            if not self.is_current(generation):
+                return
+            try:
+                result = func(*args)
+            except Exception as error:
+                if error_callback and self.is_current(generation):
+                    error_callback(error)
+                else:
+                    print(f"Ошибка фоновой задачи: {error}")
+                return
+            if callback and self.is_current(generation):
+                callback(result)
+
+        self._executor.submit(run)
+        return generation
+
+    def is_current(self, generation: int) -> bool:
+        """Возвращает True, если задача с номером generation не устарела."""
+        return generation == self._generation
+
+    def cancel(self):
+        """Делает устаревшими все поставленные задачи."""
+        with self._lock:
+            self._generation += 1
+
+    def shutdown(self):
+        """Отменяет задачи и останавливает фоновый поток."""
+        self.cancel()
+        self._executor.shutdown(wait=False)
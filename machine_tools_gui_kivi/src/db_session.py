@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит менеджер подключений к базе данных станков, общий для всего приложения.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+from machine_tools import Finder, ListMachineInfoFormatter, MachineInfo
+from machine_tools import update as machine_tool_update
+
+
+class FinderPool:
+    """
+    Пул открытых объектов Finder (каждый держит свое подключение к базе данных).
+
+    Объекты создаются по мере необходимости, но не более size. Если все объекты заняты, запрос ожидает
+    освобождения объекта или места в пуле. Объект, при работе с которым произошла ошибка, закрывается
+    и не возвращается в пул, а ожидающий запрос создает вместо него новый.
+
+    Args:
+        factory: Функция создания и открытия объекта Finder
+        size (int): Максимальное количество объектов
+        timeout (float): Время ожидания свободного объекта, с
+    """
+
+    def __init__(self, factory: Callable[[], Finder], size: int = 4, timeout: float = 30.0):
+        self.factory = factory
+        self.size = size
+        self.timeout = timeout
+        self._idle: List[Finder] = []
+        self._created = 0
+        self._available = threading.Condition()
+
+    @contextmanager
+    def acquire(self):
+        """
+        Выдает объект Finder из пула на время блока with.
+
+        Raises:
+            TimeoutError: За timeout секунд не освободился ни один объект
+        """
+        finder = self._take()
+        try:
+            yield finder
+        except Exception:
+            self._discard(finder)
+            raise
+        else:
+            with self._available:
+                self._idle.append(finder)
+                self._available.notify()
+
+    def close(self):
+        """Закрывает все свободные объекты пула."""
+        with self._available:
+            idle, self._idle = self._idle, []
+        for finder in idle:
+            self._discard(finder)
+
+    def _take(self) -> Finder:
+        """Возвращает свободный объект или создает новый, если размер пула позволяет, иначе ожидает."""
+        deadline = time.monotonic() + self.timeout
+        with self._available:
+            while not self._idle and self._created >= self.size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Нет свободного подключения к базе данных за {self.timeout} с (размер пула {self.size})"
+                    )
+                self._available.wait(remaining)
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+        try:
+            return self.factory()
+        except Exception:
+            self._release_slot()
+            raise
+
+    def _discard(self, finder: Finder):
+        """Закрывает объект и освобождает его место в пуле."""
+        self._release_slot()
+        try:
+            finder.__exit__(None, None, None)
+        except Exception as error:
+            print(f"Ошибка закрытия подключения к базе данных: {error}")
+
+    def _release_slot(self):
+        """Уменьшает счетчик созданных объектов и будит запрос, ожидающий места в пуле."""
+        with self._available:
+            self._created -= 1
+            self._available.notify()
+
+
+class DatabaseSessionManager:
+    """
+    Менеджер подключений к базе данных станков.
+
+    Создается один раз при запуске приложения и используется всеми запросами: открытые подключения
+    переиспользуются, поэтому затраты на установку соединения не повторяются при каждом запросе.
+
+    Args:
+        pool_size (int): Максимальное количество одновременно открытых подключений для чтения данных станков
+    """
+
+    def __init__(self, pool_size: int = 4):
+        self.pool_size = pool_size
+        self._records = FinderPool(self._create_records_finder, size=pool_size)
+        self._names = FinderPool(self._create_finder, size=1)
+        self._write_lock = threading.Lock()
+
+    @staticmethod
+    def _create_finder() -> Finder:
+        """Создает и открывает Finder, возвращающий названия станков."""
+        finder = Finder(limit=None)
+        finder.__enter__()
+        return finder
+
+    @staticmethod
+    def _create_records_finder() -> Finder:
+        """Создает и открывает Finder, возвращающий данные станков (MachineInfo)."""
+        finder = DatabaseSessionManager._create_finder()
+        finder.set_formatter(ListMachineInfoFormatter())
+        return finder
+
+    def find_all_names(self) -> List[str]:
+        """Возвращает названия всех станков."""
+        with self._names.acquire() as finder:
+            return finder.find_all()
+
+    def load_all_machines(self) -> List[MachineInfo]:
+        """Возвращает полные данные всех станков (включая технические требования) одним запросом."""
+        with self._records.acquire() as finder:
+            return finder.find_all()
+
+    def info_by_name(self, name: str) -> Optional[MachineInfo]:
+        """Возвращает данные станка по точному названию или None, если станок не найден."""
+        with self._records.acquire() as finder:
+            machines = finder.find_by_name(name=name, exact_match=True)
+        return machines[0] if machines else None
+
+    def update(self, info: MachineInfo) -> bool:
+        """
+        Записывает данные станка в базу данных.
+
+        ВАЖНО! machine_tools.update открывает собственную сессию, поэтому записи только выполняются
+        последовательно через менеджер, а подключения для них не переиспользуются.
+        """
+        with self._write_lock:
+            return machine_tool_update(info)
+
+    def close(self):
+        """Закрывает все открытые подключения."""
+        self._records.close()
+        self._names.close()
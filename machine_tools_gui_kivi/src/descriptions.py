@@ -1,9 +1,24 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
-from typing import Union
-
-from machine_tools import ACCURACY_DESCRIPTIONS, GROUP_DESCRIPTIONS, TYPE_DESCRIPTIONS, Accuracy, Specialization
+"""
+Модуль содержит таблицы описаний классификационных полей станков для выпадающих списков редактора.
+
+Таблицы строятся один раз при импорте модуля, функции возвращают готовые значения без перебора описаний.
+"""
+from enum import Enum
+from typing import Dict, List, Type, Union
+
+from machine_tools import (
+    ACCURACY_DESCRIPTIONS,
+    GROUP_DESCRIPTIONS,
+    TYPE_DESCRIPTIONS,
+    Accuracy,
+    Automation,
+    SoftwareControl,
+    Specialization,
+    WeightClass,
+)
 
 
 def get_group_fields_descriptions() -> list[str]:
@@ -41,6 +56,24 @@ def get_group_fields_descriptions() -> list[str]:
 GROUP_FIELDS_DESCRIPTIONS = get_group_fields_descriptions()
 
 
+def _build_type_fields_descriptions() -> Dict[str, List[str]]:
+    """
+    Строит таблицу описаний типов станков по номеру группы.
+
+    Ключ TYPE_DESCRIPTIONS имеет вид "<номер группы>, <номер типа>", в описании типа номер группы не указывается.
+    """
+    fields = {}
+    for type_, descriptions in TYPE_DESCRIPTIONS.items():
+        group_id, separator, type_id = type_.partition(", ")
+        field = f"{type_id if separator else type_} : {descriptions}"
+        fields.setdefault(group_id, []).append(field)
+    return fields
+
+
+# Описания типов станков по номеру группы (в виде строки)
+TYPE_FIELDS_DESCRIPTIONS = _build_type_fields_descriptions()
+
+
 def get_type_fields_descriptions(group_id: Union[int, str]) -> list[str]:
     """
     Возвращает список описаний типов станков.
@@ -66,35 +99,62 @@ def get_type_fields_descriptions(group_id: Union[int, str]) -> list[str]:
 
     Сами типы определяются в пакете machine_tools.
     """
-    group_id = str(group_id)
-    fields = []
-    for type_, descriptions in TYPE_DESCRIPTIONS.items():
-        if type_.startswith(group_id):
-            type_ = type_.replace(f"{group_id}, ", "", 1)
-            field = f"{type_} : {descriptions}"
-            fields.append(field)
-    return fields
+    return list(TYPE_FIELDS_DESCRIPTIONS.get(str(group_id), []))
+
+
+ACCURACY_FIELDS_DESCRIPTIONS = list(ACCURACY_DESCRIPTIONS.values())
+
+# Точность станка по описанию
+ACCURACY_BY_DESCRIPTION = {description: Accuracy(accuracy) for accuracy, description in ACCURACY_DESCRIPTIONS.items()}
 
 
 def get_accuracy_fields_descriptions() -> list[str]:
     """
     Возвращает список описаний точности станков (Только описание).
     """
-    return list(ACCURACY_DESCRIPTIONS.values())
+    return list(ACCURACY_FIELDS_DESCRIPTIONS)
 
 
 def get_accuracy_by_description(description: str) -> Accuracy:
     """
     Возвращает точность станка по его описанию.
     """
-    description_index = list(ACCURACY_DESCRIPTIONS.values()).index(description)
-    accuracy = list(ACCURACY_DESCRIPTIONS.keys())[description_index]
-    accuracy_cls = Accuracy(accuracy)
-    return accuracy_cls
+    try:
+        return ACCURACY_BY_DESCRIPTION[description]
+    except KeyError:
+        raise ValueError(f"Неизвестное описание точности станка: {description}") from None
+
+
+# Значения перечислений, выбираемых в выпадающих списках: перечисление -> список значений
+ENUM_FIELDS_DESCRIPTIONS: Dict[Type[Enum], List[str]] = {
+    enum_cls: list(enum_cls.get_values()) for enum_cls in (Automation, SoftwareControl, Specialization, WeightClass)
+}
+
+# Элементы перечислений по значению из выпадающего списка: перечисление -> {значение: элемент}
+ENUM_BY_DESCRIPTION: Dict[Type[Enum], Dict[str, Enum]] = {
+    enum_cls: {value: enum_cls(value) for value in values} for enum_cls, values in ENUM_FIELDS_DESCRIPTIONS.items()
+}
+
+
+def get_enum_fields_descriptions(enum_cls: Type[Enum]) -> list[str]:
+    """
+    Возвращает список значений перечисления для выпадающего списка (Automation, SoftwareControl и т.д.).
+    """
+    return list(ENUM_FIELDS_DESCRIPTIONS[enum_cls])
+
+
+def get_enum_by_description(enum_cls: Type[Enum], description: str) -> Enum:
+    """
+    Возвращает элемент перечисления по значению, выбранному в выпадающем списке.
+    """
+    try:
+        return ENUM_BY_DESCRIPTION[enum_cls][description]
+    except KeyError:
+        raise ValueError(f"Неизвестное значение {enum_cls.__name__}: {description}") from None
 
 
 def get_specialization_fields_descriptions() -> list[str]:
     """
     Возвращает список описаний специализаций станков.
     """
-    return Specialization.get_values()
+    return get_enum_fields_descriptions(Specialization)
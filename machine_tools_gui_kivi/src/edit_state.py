@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит состояние редактирования данных станка.
+"""
+from typing import Any, Dict, List, Optional
+
+from machine_tools import MachineInfo
+
+from machine_tools_gui_kivi.src.machine_diff import MachineDiff, copy_machine_info
+
+
+class MachineEditState:
+    """
+    Изменения данных станка поверх исходной записи (без копирования записи).
+
+    Исходная запись base не изменяется и не копируется: состояние хранит только измененные поля,
+    значения технических требований и переименования требований. Объект MachineInfo с изменениями
+    создается только при сохранении (см. materialize).
+
+    Args:
+        base (MachineInfo): Исходные данные станка
+    """
+
+    def __init__(self, base: MachineInfo):
+        self.base = base
+        self._fields: Dict[str, Any] = {}
+        self._values: Dict[str, Any] = {}  # Новые значения требований по текущему названию
+        self._renamed: Dict[str, str] = {}  # Исходное название требования -> текущее
+        self._origin: Dict[str, str] = {}  # Текущее название переименованного требования -> исходное
+        self._added: List[str] = []  # Названия требований, которых нет в исходной записи
+
+    @property
+    def name(self) -> str:
+        """Текущее название станка."""
+        return self.get("name")
+
+    def get(self, field: str) -> Any:
+        """Возвращает текущее значение поля MachineInfo."""
+        if field in self._fields:
+            return self._fields[field]
+        return getattr(self.base, field)
+
+    def set(self, field: str, value: Any):
+        """Устанавливает новое значение поля MachineInfo."""
+        self._fields[field] = value
+
+    def has_requirement(self, name: str) -> bool:
+        """Возвращает True, если техническое требование с названием name есть в текущих данных."""
+        if name in self._added or name in self._origin:
+            return True
+        return name in (self.base.technical_requirements or {}) and name not in self._renamed
+
+    def get_requirement(self, name: str) -> Optional[Any]:
+        """Возвращает текущее значение технического требования или None, если требования нет."""
+        if name in self._values:
+            return self._values[name]
+        original = self._origin.get(name, name)
+        if original in self._renamed and self._renamed[original] != name:
+            return None
+        return (self.base.technical_requirements or {}).get(original)
+
+    def set_requirement(self, name: str, value: Any):
+        """Устанавливает значение технического требования (добавляет требование, если его нет)."""
+        if not self.has_requirement(name):
+            self._added.append(name)
+        self._values[name] = value
+
+    def rename_requirement(self, old_name: str, new_name: str):
+        """Переименовывает техническое требование с сохранением его значения и позиции."""
+        if old_name in self._values:
+            self._values[new_name] = self._values.pop(old_name)
+        if old_name in self._added:
+            self._added[self._added.index(old_name)] = new_name
+            return
+        original = self._origin.pop(old_name, old_name)
+        self._renamed[original] = new_name
+        self._origin[new_name] = original
+
+    def apply(self, diff: MachineDiff):
+        """
+        Применяет изменения diff поверх текущего состояния (например, изменения, которые не удалось записать).
+
+        Удаление технических требований редактором не поддерживается, поэтому removed_requirements не применяются.
+        """
+        for field, value in diff.fields.items():
+            self.set(field, value)
+        for old_name, new_name in diff.renamed_requirements.items():
+            if self.has_requirement(old_name):
+                self.rename_requirement(old_name, new_name)
+        for name, value in diff.requirements.items():
+            self.set_requirement(name, value)
+
+    def requirements(self) -> Dict[str, Any]:
+        """Возвращает технические требования с учетом изменений (в исходном порядке, новые - в конце)."""
+        result = {}
+        for original, value in (self.base.technical_requirements or {}).items():
+            name = self._renamed.get(original, original)
+            result[name] = self._values.get(name, value)
+        for name in self._added:
+            result[name] = self._values.get(name)
+        return result
+
+    def diff(self) -> MachineDiff:
+        """Возвращает изменения относительно исходной записи."""
+        fields = {field: value for field, value in self._fields.items() if getattr(self.base, field) != value}
+        if not (self._values or self._renamed or self._added):
+            return MachineDiff(fields)
+        base_requirements = self.base.technical_requirements or {}
+        renamed = {original: name for original, name in self._renamed.items() if original != name}
+        requirements = {}
+        for name, value in self.requirements().items():
+            original = self._origin.get(name, name)
+            # Требование с названием, освобожденным переименованием, - новое требование
+            is_new = original not in base_requirements or (original == name and name in renamed)
+            if is_new or base_requirements[original] != value:
+                requirements[name] = value
+        removed = [name for name in base_requirements if name not in renamed and not self.has_requirement(name)]
+        return MachineDiff(fields, requirements, removed, renamed)
+
+    def materialize(self) -> MachineInfo:
+        """Создает объект MachineInfo с примененными изменениями (порядок технических требований сохраняется)."""
+        update = self.diff().fields
+        if self._values or self._renamed or self._added:
+            update["technical_requirements"] = self.requirements()
+        return copy_machine_info(self.base, update)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит фасетный индекс станков: отбор по группе, типу, точности, автоматизации и другим
+классификационным полям с подсчетом количества станков для каждого значения.
+"""
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from machine_tools import ACCURACY_DESCRIPTIONS, TYPE_DESCRIPTIONS, MachineInfo
+
+from machine_tools_gui_kivi.src.descriptions import GROUP_FIELDS_DESCRIPTIONS
+from machine_tools_gui_kivi.src.local_replica import COLUMNS
+
+# Фасеты: имя фасета -> функция получения значения из MachineInfo
+FACETS: Dict[str, Callable[[MachineInfo], Any]] = {
+    "group": COLUMNS["machine_group"],
+    # Номер типа уникален только внутри группы
+    "type": lambda info: (int(info.group), int(info.type)),
+    "accuracy": COLUMNS["accuracy"],
+    "automation": COLUMNS["automation"],
+    "specialization": COLUMNS["specialization"],
+    "weight_class": COLUMNS["weight_class"],
+    "software_control": COLUMNS["software_control"],
+}
+
+# Описания групп по номеру группы
+_GROUP_LABELS = {field.split(" : ")[0]: field for field in GROUP_FIELDS_DESCRIPTIONS}
+
+# Множество выбранных значений по фасетам; фасет без значений не ограничивает отбор
+Selection = Dict[str, Iterable[Any]]
+
+
+def popcount(bitmap: int) -> int:
+    """Возвращает количество установленных битов (int.bit_count появился только в Python 3.10)."""
+    return bin(bitmap).count("1")
+
+
+def bitmap_from_numbers(numbers: Iterable[int], size: int) -> int:
+    """Возвращает битовую маску размером size бит с установленными битами numbers."""
+    bits = bytearray((size + 7) // 8)
+    for number in numbers:
+        bits[number >> 3] |= 1 << (number & 7)
+    return int.from_bytes(bits, "little")
+
+
+def numbers_from_bitmap(bitmap: int) -> Iterator[int]:
+    """Возвращает номера установленных битов маски по возрастанию."""
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for position, byte in enumerate(data):
+        if byte:
+            for bit in range(8):
+                if byte >> bit & 1:
+                    yield position * 8 + bit
+
+
+def facet_label(facet: str, value: Any) -> str:
+    """Возвращает текст значения фасета для отображения в интерфейсе."""
+    if facet == "group":
+        return _GROUP_LABELS.get(str(value), str(value))
+    if facet == "type":
+        group, type_ = value
+        return f"{group}.{type_} : {TYPE_DESCRIPTIONS.get(f'{group}, {type_}', '')}"
+    if facet == "accuracy":
+        return ACCURACY_DESCRIPTIONS.get(value, str(value))
+    return str(value)
+
+
+class FacetIndex:
+    """
+    Битовые индексы станков по значениям фасетов.
+
+    Каждому станку присваивается порядковый номер, а каждому значению фасета - целое число, в котором
+    установлены биты станков с этим значением. Отбор по нескольким фасетам выполняется пересечением (&)
+    битовых масок, объединение значений внутри фасета - объединением (|), количество станков - подсчетом битов.
+
+    Индекс не изменяется после построения: при изменении данных строится новый индекс.
+
+    Args:
+        records: Данные станков
+        facets: Фасеты (по умолчанию FACETS)
+    """
+
+    def __init__(self, records: Iterable[MachineInfo] = (), facets: Optional[Dict[str, Callable]] = None):
+        self.facets = facets if facets is not None else FACETS
+        self._records: List[MachineInfo] = list(records)
+        self._bitmaps: Dict[str, Dict[Any, int]] = {facet: {} for facet in self.facets}
+        for number, info in enumerate(self._records):
+            bit = 1 << number
+            for facet, getter in self.facets.items():
+                value = getter(info)
+                bitmaps = self._bitmaps[facet]
+                bitmaps[value] = bitmaps.get(value, 0) | bit
+        self._all = (1 << len(self._records)) - 1
+
+    def __len__(self):
+        return len(self._records)
+
+    def values(self, facet: str) -> List[Any]:
+        """Возвращает значения фасета, встречающиеся в данных станков."""
+        return sorted(value for value in self._bitmaps[facet] if value is not None)
+
+    def bitmap(self, selection: Selection, exclude: Optional[str] = None) -> int:
+        """
+        Возвращает битовую маску станков, удовлетворяющих отбору.
+
+        Args:
+            selection: Выбранные значения фасетов
+            exclude: Фасет, который не учитывается в отборе (для подсчета количества по этому фасету)
+        """
+        result = self._all
+        for facet, values in selection.items():
+            if facet == exclude or not values:
+                continue
+            mask = 0
+            bitmaps = self._bitmaps[facet]
+            for value in values:
+                mask |= bitmaps.get(value, 0)
+            result &= mask
+        return result
+
+    def count(self, selection: Selection) -> int:
+        """Возвращает количество станков, удовлетворяющих отбору."""
+        return popcount(self.bitmap(selection))
+
+    def records(self, selection: Selection) -> List[MachineInfo]:
+        """Возвращает данные станков, удовлетворяющих отбору."""
+        return self.records_of(self.bitmap(selection))
+
+    def records_of(self, bitmap: int) -> List[MachineInfo]:
+        """Возвращает данные станков, биты которых установлены в маске bitmap."""
+        return [self._records[number] for number in numbers_from_bitmap(bitmap)]
+
+    def counts(self, selection: Selection) -> Dict[str, Dict[Any, int]]:
+        """
+        Возвращает количество станков для каждого значения каждого фасета при текущем отборе.
+
+        Для фасета учитывается отбор по всем остальным фасетам, но не по нему самому: так видно,
+        сколько станков будет найдено при выборе другого значения этого фасета.
+        """
+        result = {}
+        for facet, bitmaps in self._bitmaps.items():
+            base = self.bitmap(selection, exclude=facet)
+            result[facet] = {value: popcount(base & bits) for value, bits in bitmaps.items() if value is not None}
+        return result
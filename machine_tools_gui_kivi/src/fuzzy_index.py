@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит нечеткий поиск названий станков: без учета раскладки (кириллица/латиница), пробелов и дефисов,
+а также с допуском опечаток.
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from machine_tools_gui_kivi.src.search_index import NGramIndex
+
+# Кириллические буквы, совпадающие по начертанию с латинскими, и разделители, которые не учитываются при поиске
+_FOLD = str.maketrans(
+    {
+        "А": "A",
+        "В": "B",
+        "Е": "E",
+        "Ё": "E",
+        "К": "K",
+        "М": "M",
+        "Н": "H",
+        "О": "O",
+        "Р": "P",
+        "С": "C",
+        "Т": "T",
+        "У": "Y",
+        "Х": "X",
+        " ": None,
+        "-": None,
+        "‐": None,
+        "–": None,
+        "—": None,
+        "_": None,
+    }
+)
+
+
+def search_key(name: str) -> str:
+    """
+    Возвращает ключ нечеткого поиска: верхний регистр (как в normalize_name), кириллические буквы,
+    совпадающие по начертанию с латинскими, заменены латинскими, пробелы и дефисы удалены.
+
+    Например, "16К20Ф3", "16K20Ф3" и "16к-20ф3" дают один ключ.
+    """
+    return name.upper().translate(_FOLD)
+
+
+def edit_distance(first: str, second: str, max_distance: Optional[int] = None) -> int:
+    """
+    Возвращает расстояние Левенштейна между строками.
+
+    Если задан max_distance и расстояние его превышает, вычисление прекращается досрочно
+    и возвращается max_distance + 1.
+    """
+    if first == second:
+        return 0
+    if len(first) < len(second):
+        first, second = second, first
+    if max_distance is not None and len(first) - len(second) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(second) + 1))
+    for i, first_char in enumerate(first, 1):
+        current = [i]
+        append = current.append
+        distance = i
+        for j, second_char in enumerate(second):
+            # Минимум из вставки (distance + 1), удаления (previous[j + 1] + 1) и замены (previous[j] + 0/1)
+            distance += 1
+            deletion = previous[j + 1] + 1
+            if deletion < distance:
+                distance = deletion
+            substitution = previous[j] + (first_char != second_char)
+            if substitution < distance:
+                distance = substitution
+            append(distance)
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """
+    BK-дерево строк для поиска строк на расстоянии Левенштейна не больше заданного.
+
+    Потомки узла хранятся по расстоянию до него; по неравенству треугольника при поиске с допуском d
+    просматриваются только потомки на расстоянии от D - d до D + d, где D - расстояние от запроса до узла.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self._root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: str):
+        """Добавляет строку в дерево (повторное добавление игнорируется)."""
+        if self._root is None:
+            self._root = (key, {})
+            return
+        node_key, children = self._root
+        while True:
+            distance = edit_distance(key, node_key)
+            if distance == 0:
+                return
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (key, {})
+                return
+            node_key, children = child
+
+    def search(self, query: str, max_distance: int) -> List[Tuple[int, str]]:
+        """Возвращает пары (расстояние, строка) для строк на расстоянии не больше max_distance от query."""
+        if self._root is None:
+            return []
+        result = []
+        stack = [self._root]
+        while stack:
+            node_key, children = stack.pop()
+            distance = edit_distance(query, node_key)
+            if distance <= max_distance:
+                result.append((distance, node_key))
+            for child_distance in range(distance - max_distance, distance + max_distance + 1):
+                child = children.get(child_distance)
+                if child is not None:
+                    stack.append(child)
+        return result
+
+
+class FuzzyIndex:
+    """
+    Индекс для нечеткого поиска названий станков.
+
+    Названия приводятся к ключу поиска (см. search_key). Сначала ищется вхождение ключа запроса в ключи названий
+    (n-граммный индекс по ключам), а если таких нет - ключи на расстоянии Левенштейна не больше допуска
+    (BK-дерево), поэтому сравниваются не все названия каталога.
+
+    Новые ключи попадают в BK-дерево не при добавлении названий, а при вызове build_tree, поэтому загрузка
+    каталога не замедляется: каталог строит дерево в фоновом потоке после загрузки. Пока ключ не добавлен
+    в дерево, он проверяется при поиске с учетом опечаток прямым сравнением. Удаленные ключи остаются
+    в BK-дереве и пропускаются при поиске.
+
+    Args:
+        names: Начальный список названий
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._names_by_key: Dict[str, List[str]] = {}
+        self._keys = NGramIndex()
+        self._tree = BKTree()
+        self._tree_pending: List[str] = []  # Ключи, еще не добавленные в BK-дерево
+        self._tree_lock = threading.Lock()
+        self.add(names)
+
+    @staticmethod
+    def max_distance(key: str) -> int:
+        """Допустимое количество опечаток для ключа запроса: 1 для коротких запросов, 2 для длинных."""
+        return 1 if len(key) < 8 else 2
+
+    def add(self, names: Iterable[str]):
+        """Добавляет названия в индекс."""
+        new_keys = []
+        for name in names:
+            key = search_key(name)
+            names_of_key = self._names_by_key.setdefault(key, [])
+            if name in names_of_key:
+                continue
+            if not names_of_key:
+                new_keys.append(key)
+            names_of_key.append(name)
+        self._keys.add(new_keys)
+        with self._tree_lock:
+            self._tree_pending.extend(new_keys)
+
+    def remove(self, names: Iterable[str]):
+        """Удаляет названия из индекса."""
+        removed_keys = []
+        for name in names:
+            key = search_key(name)
+            names_of_key = self._names_by_key.get(key)
+            if not names_of_key or name not in names_of_key:
+                continue
+            names_of_key.remove(name)
+            if not names_of_key:
+                del self._names_by_key[key]
+                removed_keys.append(key)
+        self._keys.remove(removed_keys)
+        if self._keys.needs_compaction:
+            # Новый индекс подставляется целиком: поиск без блокировки продолжает работать со старым
+            self._keys = self._keys.compacted()
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Возвращает названия, похожие на query: сначала по вхождению ключа, иначе с учетом опечаток.
+
+        Результат упорядочен: для вхождения ключа - как в NGramIndex.search, для опечаток - по расстоянию.
+        Если задан limit, возвращается не более limit названий.
+        """
+        key = search_key(query)
+        if not key:
+            return []
+        keys = self._keys.search(key, limit)
+        if not keys:
+            found = self._tree_search(key)
+            # Ключ, удаленный и снова добавленный до build_tree, есть и в дереве, и среди новых ключей
+            keys = list(dict.fromkeys(found_key for _, found_key in sorted(found) if found_key in self._names_by_key))
+        names = [name for found_key in keys for name in self._names_by_key.get(found_key, ())]
+        return names[:limit] if limit is not None else names
+
+    def build_tree(self, chunk_size: int = 500):
+        """
+        Добавляет в BK-дерево ключи, добавленные в индекс после предыдущего вызова.
+
+        Ключи добавляются порциями по chunk_size, между порциями блокировка дерева освобождается,
+        поэтому поиск во время построения не ожидает окончания построения.
+        """
+        while True:
+            with self._tree_lock:
+                chunk = self._tree_pending[:chunk_size]
+                if not chunk:
+                    return
+                for key in chunk:
+                    self._tree.add(key)
+                del self._tree_pending[:chunk_size]
+
+    def _tree_search(self, key: str) -> List[Tuple[int, str]]:
+        """Ищет ключи с учетом опечаток в BK-дереве и среди ключей, еще не добавленных в дерево."""
+        max_distance = self.max_distance(key)
+        with self._tree_lock:
+            found = self._tree.search(key, max_distance)
+            for pending in self._tree_pending:
+                distance = edit_distance(key, pending, max_distance)
+                if distance <= max_distance:
+                    found.append((distance, pending))
+        return found
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит локальную копию (реплику) таблицы станков в файле SQLite для работы без подключения к базе данных.
+
+Данные станка хранятся целиком в виде JSON, а поля, по которым выполняется поиск и сортировка,
+дополнительно вынесены в отдельные индексированные столбцы.
+"""
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+from machine_tools import MachineInfo
+
+from machine_tools_gui_kivi.src.machine_cache import normalize_name
+
+REPLICA_VERSION = 1  # Версия формата файла реплики
+
+# Столбцы таблицы machines, заполняемые из полей MachineInfo: имя столбца -> функция получения значения
+COLUMNS = {
+    "name": lambda info: info.name,
+    "machine_group": lambda info: int(info.group),
+    "machine_type": lambda info: int(info.type),
+    "power": lambda info: info.power,
+    "efficiency": lambda info: info.efficiency,
+    "weight": lambda info: info.weight,
+    "accuracy": lambda info: _value(info.accuracy),
+    "automation": lambda info: _value(info.automation),
+    "specialization": lambda info: _value(info.specialization),
+    "weight_class": lambda info: _value(info.weight_class),
+    "software_control": lambda info: _value(info.software_control),
+    "length": lambda info: info.dimensions.length if info.dimensions else None,
+    "width": lambda info: info.dimensions.width if info.dimensions else None,
+    "height": lambda info: info.dimensions.height if info.dimensions else None,
+}
+
+# Индексы таблицы machines
+INDEXES = {
+    "idx_machines_group_type": ("machine_group", "machine_type"),
+    "idx_machines_power": ("power",),
+    "idx_machines_weight": ("weight",),
+}
+
+
+def _value(field):
+    """Возвращает значение перечисления или само поле, если это не перечисление."""
+    return getattr(field, "value", field)
+
+
+def machine_info_to_json(info: MachineInfo) -> str:
+    """Сериализует MachineInfo в JSON (поддерживаются pydantic 1 и 2)."""
+    if hasattr(info, "model_dump_json"):
+        return info.model_dump_json()
+    return info.json()
+
+
+def machine_info_from_json(data: str) -> MachineInfo:
+    """Восстанавливает MachineInfo из JSON (поддерживаются pydantic 1 и 2)."""
+    if hasattr(MachineInfo, "model_validate_json"):
+        return MachineInfo.model_validate_json(data)
+    return MachineInfo.parse_raw(data)
+
+
+def default_replica_path() -> Path:
+    """Возвращает путь к файлу реплики по умолчанию (в домашнем каталоге пользователя)."""
+    return Path.home() / ".machine_tools_gui_kivi" / "replica.sqlite3"
+
+
+class LocalReplica:
+    """
+    Локальная копия таблицы станков в файле SQLite.
+
+    Чтение выполняется через одно соединение только для чтения, открываемое при первом обращении
+    (таблицы при чтении не создаются). Если файла реплики нет или он сохранен в другой версии формата,
+    чтение завершается ошибкой FileNotFoundError.
+
+    Args:
+        path: Путь к файлу реплики
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path) if path else default_replica_path()
+        self._reader: Optional[sqlite3.Connection] = None
+        self._reader_lock = threading.Lock()
+
+    def exists(self) -> bool:
+        """Возвращает True, если файл реплики существует."""
+        return self.path.is_file()
+
+    def check(self):
+        """Вызывает FileNotFoundError, если файла реплики нет или он сохранен в другой версии формата."""
+        with self._reader_lock:
+            self._open_reader()
+
+    @staticmethod
+    def is_valid(connection: sqlite3.Connection) -> bool:
+        """Возвращает True, если реплика сохранена в текущей версии формата."""
+        try:
+            row = connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        except sqlite3.Error:
+            return False
+        return row is not None and row[0] == str(REPLICA_VERSION)
+
+    def connect(self) -> sqlite3.Connection:
+        """Открывает соединение с файлом реплики, создавая таблицы и индексы при необходимости."""
+        os.makedirs(self.path.parent, exist_ok=True)
+        connection = sqlite3.connect(str(self.path))
+        columns = ", ".join(COLUMNS)
+        connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS machines "
+            f"(key TEXT PRIMARY KEY, position INTEGER, {columns}, data TEXT NOT NULL)"
+        )
+        for index_name, index_columns in INDEXES.items():
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON machines ({', '.join(index_columns)})")
+        return connection
+
+    def replicate(self, records: Iterable[MachineInfo]) -> int:
+        """
+        Заменяет содержимое реплики данными records одной транзакцией.
+
+        Returns:
+            int: Количество записанных станков
+        """
+        rows = [self._to_row(position, info) for position, info in enumerate(records)]
+        placeholders = ", ".join("?" for _ in range(len(COLUMNS) + 3))
+        with closing(self.connect()) as connection, connection:
+            connection.execute("DELETE FROM machines")
+            connection.executemany(f"INSERT INTO machines VALUES ({placeholders})", rows)
+            connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?), (?, ?)",
+                ("version", str(REPLICA_VERSION), "replicated_at", str(time.time())),
+            )
+        return len(rows)
+
+    def names(self) -> List[str]:
+        """Возвращает названия всех станков реплики в порядке каталога."""
+        return [row[0] for row in self._query("SELECT name FROM machines ORDER BY position")]
+
+    def records(self) -> List[MachineInfo]:
+        """Возвращает данные всех станков реплики в порядке каталога."""
+        return [machine_info_from_json(row[0]) for row in self._query("SELECT data FROM machines ORDER BY position")]
+
+    def get(self, name: str) -> Optional[MachineInfo]:
+        """Возвращает данные станка по названию или None, если станка нет в реплике."""
+        rows = self._query("SELECT data FROM machines WHERE key = ?", (normalize_name(name),))
+        return machine_info_from_json(rows[0][0]) if rows else None
+
+    def close(self):
+        """Закрывает соединение для чтения."""
+        with self._reader_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    def _query(self, sql: str, parameters: tuple = ()) -> List[tuple]:
+        """Выполняет запрос чтения через общее соединение (чтение выполняется из разных потоков)."""
+        with self._reader_lock:
+            return self._open_reader().execute(sql, parameters).fetchall()
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Открывает соединение для чтения при первом обращении, проверяя наличие и версию реплики."""
+        if self._reader is not None:
+            return self._reader
+        if not self.exists():
+            raise FileNotFoundError(f"Локальная реплика не найдена: {self.path}. Сначала выполните команду replicate")
+        connection = sqlite3.connect(f"{self.path.as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        if not self.is_valid(connection):
+            connection.close()
+            raise FileNotFoundError(
+                f"Локальная реплика {self.path} сохранена в другой версии формата. Сначала выполните команду replicate"
+            )
+        self._reader = connection
+        return connection
+
+    def _to_row(self, position: int, info: MachineInfo) -> tuple:
+        """Возвращает строку таблицы machines для станка."""
+        values = tuple(get_value(info) for get_value in COLUMNS.values())
+        return (normalize_name(info.name), position) + values + (machine_info_to_json(info),)
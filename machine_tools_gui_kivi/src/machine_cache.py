@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит кэш данных станков, полученных из базы данных.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from machine_tools import MachineInfo
+
+
+def normalize_name(name: str) -> str:
+    """Приводит название станка к виду, используемому при поиске: верхний регистр, без пробелов."""
+    return name.upper().replace(" ", "")
+
+
+class MachineInfoCache:
+    """
+    Кэш объектов MachineInfo с вытеснением давно не использованных записей (LRU) и временем жизни записей.
+
+    Ключ записи - нормализованное название станка (см. normalize_name). Отсутствие станка в базе данных не кэшируется.
+
+    Args:
+        maxsize (int): Максимальное количество записей
+        ttl (float): Время жизни записи, с
+        clock: Функция, возвращающая текущее время в секундах
+    """
+
+    def __init__(self, maxsize: int = 64, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._records: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def get(self, name: str) -> Optional[MachineInfo]:
+        """Возвращает данные станка из кэша или None, если записи нет или ее время жизни истекло."""
+        key = normalize_name(name)
+        with self._lock:
+            record = self._records.get(key)
+            if record is None:
+                return None
+            info, expires_at = record
+            if expires_at <= self._clock():
+                del self._records[key]
+                return None
+            self._records.move_to_end(key)
+            return info
+
+    def put(self, name: str, info: MachineInfo):
+        """Сохраняет данные станка в кэш."""
+        key = normalize_name(name)
+        with self._lock:
+            self._records[key] = (info, self._clock() + self.ttl)
+            self._records.move_to_end(key)
+            while len(self._records) > self.maxsize:
+                self._records.popitem(last=False)
+
+    def get_or_load(self, name: str, loader: Callable[[str], Optional[MachineInfo]]) -> Optional[MachineInfo]:
+        """
+        Возвращает данные станка из кэша, а при их отсутствии загружает через loader и сохраняет в кэш.
+
+        Args:
+            name: Название станка
+            loader: Функция загрузки данных станка по названию
+        """
+        info = self.get(name)
+        if info is None:
+            info = loader(name)
+            if info:
+                self.put(name, info)
+        return info
+
+    def names(self) -> List[str]:
+        """Возвращает названия станков, данные которых есть в кэше (без истекших записей)."""
+        now = self._clock()
+        with self._lock:
+            return [info.name for info, expires_at in self._records.values() if expires_at > now]
+
+    def invalidate(self, name: Optional[str] = None):
+        """Удаляет запись о станке name из кэша. Если name не указано, очищает кэш полностью."""
+        with self._lock:
+            if name is None:
+                self._records.clear()
+            else:
+                self._records.pop(normalize_name(name), None)
+
+
+MACHINE_INFO_CACHE = MachineInfoCache()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит вычисление различий между двумя версиями данных станка на уровне отдельных полей.
+"""
+import copy
+from typing import Any, Dict, Iterable, Optional
+
+from machine_tools import MachineInfo
+
+# Поля MachineInfo, редактируемые в окне редактора (технические требования сравниваются по ключам отдельно)
+MACHINE_FIELDS = (
+    "name",
+    "group",
+    "type",
+    "machine_type",
+    "power",
+    "efficiency",
+    "accuracy",
+    "automation",
+    "specialization",
+    "weight",
+    "weight_class",
+    "dimensions",
+    "location",
+    "software_control",
+)
+
+
+def copy_machine_info(info: MachineInfo, update: Optional[Dict[str, Any]] = None) -> MachineInfo:
+    """Возвращает копию MachineInfo с замененными полями update (поддерживаются pydantic 1 и 2)."""
+    update = copy.deepcopy(update or {})
+    if hasattr(info, "model_copy"):
+        return info.model_copy(update=update, deep=True)
+    return info.copy(update=update, deep=True)
+
+
+class MachineDiff:
+    """
+    Различия между двумя версиями данных станка.
+
+    Attributes:
+        fields: Измененные поля MachineInfo с новыми значениями
+        requirements: Измененные и добавленные технические требования с новыми значениями (по новым названиям)
+        removed_requirements: Названия удаленных технических требований
+        renamed_requirements: Переименования технических требований: исходное название -> новое.
+            Переименованное требование остается на своей позиции
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Dict[str, Any]] = None,
+        requirements: Optional[Dict[str, Any]] = None,
+        removed_requirements: Iterable[str] = (),
+        renamed_requirements: Optional[Dict[str, str]] = None,
+    ):
+        self.fields = dict(fields or {})
+        self.requirements = dict(requirements or {})
+        self.removed_requirements = list(removed_requirements)
+        self.renamed_requirements = dict(renamed_requirements or {})
+
+    def __bool__(self):
+        return bool(self.fields or self.requirements or self.removed_requirements or self.renamed_requirements)
+
+    def __str__(self):
+        parts = [f"{name} = {value}" for name, value in self.fields.items()]
+        parts += [f"technical_requirements[{old}] -> {new}" for old, new in self.renamed_requirements.items()]
+        parts += [f"technical_requirements[{name}] = {value}" for name, value in self.requirements.items()]
+        parts += [f"technical_requirements[{name}] удалено" for name in self.removed_requirements]
+        return "; ".join(parts) if parts else "нет изменений"
+
+    @classmethod
+    def between(cls, old: MachineInfo, new: MachineInfo) -> "MachineDiff":
+        """Вычисляет различия между данными станка old и new (переименования определяются как удаление и добавление)."""
+        fields = {name: getattr(new, name) for name in MACHINE_FIELDS if getattr(old, name) != getattr(new, name)}
+        old_requirements = old.technical_requirements or {}
+        new_requirements = new.technical_requirements or {}
+        requirements = {
+            name: value
+            for name, value in new_requirements.items()
+            if name not in old_requirements or old_requirements[name] != value
+        }
+        removed = [name for name in old_requirements if name not in new_requirements]
+        return cls(fields, requirements, removed)
+
+    def merge(self, newer: "MachineDiff") -> "MachineDiff":
+        """Возвращает различия, равные последовательному применению self и newer."""
+        renamed = dict(self.renamed_requirements)
+        origins = {new: old for old, new in renamed.items()}
+        for old, new in newer.renamed_requirements.items():
+            origin = origins.pop(old, old)
+            renamed[origin] = new
+            origins[new] = origin
+        # Значения, записанные под старыми названиями, переносятся на новые
+        requirements = {newer.renamed_requirements.get(name, name): value for name, value in self.requirements.items()}
+        removed = list(self.removed_requirements)
+        for name in newer.removed_requirements:
+            requirements.pop(name, None)
+            origin = origins.get(name, name)
+            renamed.pop(origin, None)
+            if origin not in removed:
+                removed.append(origin)
+        requirements.update(newer.requirements)
+        removed = [name for name in removed if name not in requirements]
+        renamed = {old: new for old, new in renamed.items() if old != new}
+        return MachineDiff({**self.fields, **newer.fields}, requirements, removed, renamed)
+
+    def apply(self, base: MachineInfo) -> MachineInfo:
+        """
+        Возвращает копию данных станка base с примененными изменениями.
+
+        Технические требования сохраняют порядок base: переименованные остаются на своей позиции, новые добавляются
+        в конец.
+        """
+        update = dict(self.fields)
+        if self.requirements or self.removed_requirements or self.renamed_requirements:
+            requirements = {}
+            for name, value in (base.technical_requirements or {}).items():
+                if name not in self.removed_requirements:
+                    requirements[self.renamed_requirements.get(name, name)] = value
+            requirements.update(self.requirements)
+            update["technical_requirements"] = requirements
+        return copy_machine_info(base, update)
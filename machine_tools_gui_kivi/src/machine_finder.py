@@ -1,61 +1,536 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # ---------------------------------------------------------------------------------------------------------------------
-import timeit
+"""
+Модуль содержит каталог названий станков и функции поиска по нему.
 
-import machine_tools
+Каталог не загружается при импорте модуля: загрузка запускается вызовом MachineCatalog.load_async()
+и выполняется в фоновом потоке, поэтому окно приложения строится без ожидания ответа базы данных.
+Пока загрузка не завершена, поиск выполняется по уже полученной части названий.
+Поиск по подстроке выполняется через n-граммный индекс (см. search_index.NGramIndex). Если по подстроке ничего
+не найдено, выполняется нечеткий поиск без учета раскладки, пробелов, дефисов и с допуском опечаток
+(см. fuzzy_index.FuzzyIndex).
 
-print(machine_tools.__file__)
+Если каталогу передано хранилище (см. machine_store.MachineStore), то при загрузке одним запросом читаются
+полные данные всех станков, и поиск и таблица станков не требуют обращений к базе данных (см. find_info).
+Открытый в редакторе станок при этом перечитывается из базы данных в фоне (см. load_info).
 
-from machine_tools import Finder, ListMachineInfoFormatter
+Изменения, внесенные в базу данных другими пользователями, подтягиваются периодической синхронизацией
+(см. MachineCatalog.sync): сверяется только список названий, а полные данные перечитываются лишь для добавленных,
+открытого в редакторе и находящихся в кэше станков.
 
-with Finder(limit=None) as finder:
-    MACHINE_TOOL_NAMES = finder.find_all()
+В автономном режиме (см. use_local_replica) каталог и данные станков читаются из локальной реплики SQLite,
+база данных не используется, а сохранение изменений недоступно.
+
+Все обращения к базе данных выполняются через общий менеджер подключений (см. db_session.DatabaseSessionManager),
+который приложение создает один раз при запуске (см. set_session_manager).
+"""
+import threading
+from typing import Callable, List, Optional, Tuple
+
+from machine_tools import MachineInfo
+
+from machine_tools_gui_kivi.src.db_session import DatabaseSessionManager
+from machine_tools_gui_kivi.src.fuzzy_index import FuzzyIndex
+from machine_tools_gui_kivi.src.local_replica import LocalReplica
+from machine_tools_gui_kivi.src.machine_cache import MACHINE_INFO_CACHE, normalize_name
+from machine_tools_gui_kivi.src.machine_store import MachineStore
+from machine_tools_gui_kivi.src.search_index import NGramIndex
+from machine_tools_gui_kivi.src.snapshot import CatalogSnapshot
+
+_SESSION_MANAGER: Optional[DatabaseSessionManager] = None
+
+
+def set_session_manager(manager: Optional[DatabaseSessionManager]):
+    """Устанавливает менеджер подключений, используемый для всех обращений к базе данных."""
+    global _SESSION_MANAGER
+    _SESSION_MANAGER = manager
+
+
+def get_session_manager() -> DatabaseSessionManager:
+    """Возвращает менеджер подключений (создает менеджер по умолчанию, если он не был установлен)."""
+    global _SESSION_MANAGER
+    if _SESSION_MANAGER is None:
+        _SESSION_MANAGER = DatabaseSessionManager()
+    return _SESSION_MANAGER
+
+
+def load_all_machines() -> List[MachineInfo]:
+    """Загружает из базы данных полные данные всех станков (включая технические требования) одним запросом."""
+    return get_session_manager().load_all_machines()
+
+
+def update_machine(info: MachineInfo) -> bool:
+    """Записывает данные станка в базу данных через общий менеджер подключений."""
+    return get_session_manager().update(info)
+
+
+class MachineCatalog:
+    """
+    Каталог названий станков с фоновой загрузкой из базы данных.
+
+    Состояния каталога: "idle" -> "loading" -> "ready" (или "error" при ошибке загрузки).
+    При наличии локального снимка каталог переходит в состояние "ready" сразу после чтения снимка,
+    а сверка с базой данных продолжается в фоне.
+
+    Args:
+        store (MachineStore): Хранилище для полных данных станков. Если не задано, загружаются только названия
+        snapshot (CatalogSnapshot): Локальный снимок каталога на диске
+        replica (LocalReplica): Локальная реплика, используемая вместо базы данных (автономный режим)
+        chunk_size (int): Количество названий, добавляемых в каталог за один шаг загрузки
+    """
+
+    IDLE = "idle"
+    LOADING = "loading"
+    READY = "ready"
+    ERROR = "error"
+
+    def __init__(
+        self,
+        store: Optional[MachineStore] = None,
+        snapshot: Optional[CatalogSnapshot] = None,
+        replica: Optional[LocalReplica] = None,
+        chunk_size: int = 1000,
+    ):
+        self.store = store
+        self.snapshot = snapshot
+        self.replica = replica
+        self.chunk_size = chunk_size
+        self._index = NGramIndex()
+        self._fuzzy = FuzzyIndex()
+        self._version = 0
+        self._watched: Optional[str] = None
+        self._sync_stop = threading.Event()
+        self._sync_thread = None
+        self._state = self.IDLE
+        self._lock = threading.Lock()
+        self._thread = None
+        self._listeners: List[Callable[[str], None]] = []
+
+    @property
+    def state(self) -> str:
+        """Текущее состояние каталога."""
+        return self._state
+
+    @property
+    def is_ready(self) -> bool:
+        """Возвращает True, если каталог полностью загружен."""
+        return self._state == self.READY
+
+    @property
+    def read_only(self) -> bool:
+        """Возвращает True в автономном режиме, когда изменения нельзя сохранить в базу данных."""
+        return self.replica is not None
+
+    @property
+    def version(self) -> int:
+        """Номер версии каталога, увеличивается при каждом изменении списка названий."""
+        return self._version
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Возвращает список загруженных названий.
+
+        ВАЖНО! Во время загрузки список дополняется из фонового потока.
+        """
+        return self._index.names
+
+    def add_listener(self, callback: Callable[[str], None]):
+        """
+        Добавляет обработчик изменения состояния каталога.
+
+        ВАЖНО! Обработчик вызывается из потока загрузки, обновление виджетов нужно переносить в главный поток.
+        """
+        self._listeners.append(callback)
+
+    def load_async(self):
+        """Запускает загрузку каталога в фоновом потоке, если она еще не запущена."""
+        with self._lock:
+            if self._state in (self.LOADING, self.READY):
+                return
+            self._state = self.LOADING
+        self._notify()
+        self._thread = threading.Thread(target=self._load, name="machine-catalog-loader", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Ожидает завершения загрузки. Возвращает True, если каталог загружен."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.is_ready
+
+    def filter(self, name: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Фильтрует загруженные названия по вхождению подстроки.
+
+        Результат упорядочен: полное совпадение, совпадение начала названия, вхождение подстроки.
+        Если задан limit, возвращается не более limit лучших названий.
+        Если по подстроке ничего не найдено, возвращается результат нечеткого поиска (см. fuzzy).
+        """
+        return self._index.search(name, limit) or self.fuzzy(name, limit)
+
+    def fuzzy(self, name: str, limit: Optional[int] = None) -> List[str]:
+        """Возвращает названия, похожие на name, без учета раскладки, пробелов, дефисов и с допуском опечаток."""
+        return self._fuzzy.search(name, limit)
+
+    def matches(self, name: str) -> List[str]:
+        """Возвращает названия, содержащие подстроку name, без ранжирования."""
+        return self._index.matches(name)
+
+    def rank(self, name: str, names: List[str], limit: Optional[int] = None) -> List[str]:
+        """Упорядочивает названия names, содержащие подстроку name, как в filter()."""
+        return self._index.rank(name, names, limit)
+
+    def _load(self):
+        """
+        Загружает названия (или полные данные) станков (выполняется в фоновом потоке).
+
+        Если есть локальный снимок, каталог сначала заполняется из него и сразу становится доступен для поиска,
+        затем данные сверяются с базой данных, и при расхождении каталог и снимок обновляются.
+        Как только каталог становится доступен, в том же потоке строится BK-дерево нечеткого поиска
+        (см. FuzzyIndex.build_tree).
+        """
+        try:
+            self._load_names()
+        finally:
+            self._fuzzy.build_tree()
+
+    def _load_names(self):
+        """Заполняет каталог из снимка и базы данных (см. _load)."""
+        if self.snapshot is not None and len(self._index) == 0:
+            snapshot_names = self.snapshot.load_names()
+            if snapshot_names:
+                self._extend_chunks(snapshot_names)
+                self._set_state(self.READY)
+                self._fuzzy.build_tree()
+        try:
+            names = self._fetch_names()
+        except Exception as error:
+            print(f"Ошибка загрузки каталога станков: {error}")
+            if not self.is_ready:
+                self._set_state(self.ERROR)
+            return
+        if names == self._index.names:
+            self._set_state(self.READY)
+            return
+        if len(self._index) == 0:
+            self._extend_chunks(names)
+        else:
+            self._replace(names)
+        self._set_state(self.READY)
+        if self.snapshot is not None:
+            self.snapshot.save_names(names)
+
+    def sync(self) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Подтягивает изменения каталога из базы данных без перестроения индекса.
+
+        Из базы данных читается только список названий: добавленные и удаленные названия вносятся в индекс по одному.
+        Полные данные перечитываются по одному станку только для добавленных станков и для станков, с которыми
+        сейчас работает пользователь (открытый в редакторе, см. watch, и находящиеся в кэше). Остальные записи
+        хранилища обновляются при следующей загрузке каталога.
+
+        Returns:
+            tuple: Списки добавленных, измененных и удаленных названий
+        """
+        if self.read_only or not self.is_ready:
+            return [], [], []
+        manager = get_session_manager()
+        names = manager.find_all_names()
+        fresh = set(names)
+        current = set(self._index.names)
+        added = [name for name in names if name not in current]
+        removed = [name for name in current if name not in fresh]
+        watched = [self._watched] if self._watched else []
+        # Перечитываем только станки, которые есть в каталоге и в базе данных (каждый один раз)
+        reread = [name for name in dict.fromkeys(watched + MACHINE_INFO_CACHE.names()) if name in fresh]
+        changed = []
+        for name in reread:
+            info = manager.info_by_name(name)
+            if info is None:
+                continue
+            cached = MACHINE_INFO_CACHE.get(name)
+            stored = self.store.get(name) if self.store is not None else None
+            if info != (stored if stored is not None else cached):
+                changed.append(name)
+                if self.store is not None:
+                    self.store.put(info)
+        if self.store is not None:
+            for name in added:
+                info = manager.info_by_name(name)
+                if info is not None:
+                    self.store.put(info)
+            for name in removed:
+                self.store.remove(name)
+        for name in changed + removed:
+            MACHINE_INFO_CACHE.invalidate(name)
+        if added or removed:
+            with self._lock:
+                self._index.add(added)
+                self._index.remove(removed)
+                self._compact_index()
+                self._fuzzy.add(added)
+                self._fuzzy.remove(removed)
+                self._version += 1
+            self._fuzzy.build_tree()
+            if self.snapshot is not None:
+                self.snapshot.save_names(self._index.names)
+        if added or changed or removed:
+            print(f"Синхронизация каталога: добавлено {len(added)}, изменено {len(changed)}, удалено {len(removed)}")
+            self._notify()
+        return added, changed, removed
+
+    def watch(self, name: Optional[str]):
+        """Запоминает станок, открытый в редакторе: его данные перечитываются при каждой синхронизации."""
+        self._watched = name
+
+    def apply_saved(self, old_name: str, info: MachineInfo):
+        """
+        Обновляет каталог, хранилище и кэш записанными в базу данных данными станка без повторного чтения.
+
+        Args:
+            old_name: Название станка до изменения
+            info: Записанные данные станка
+        """
+        if self.store is not None:
+            self.store.remove(old_name)
+            self.store.put(info)
+        MACHINE_INFO_CACHE.invalidate(old_name)
+        MACHINE_INFO_CACHE.put(info.name, info)
+        if self._watched and normalize_name(self._watched) == normalize_name(old_name):
+            self._watched = info.name
+        if info.name != old_name and old_name in self._index:
+            with self._lock:
+                self._index.remove([old_name])
+                self._index.add([info.name])
+                self._compact_index()
+                self._fuzzy.remove([old_name])
+                self._fuzzy.add([info.name])
+                self._version += 1
+            self._fuzzy.build_tree()
+            self._notify()
+
+    def start_sync(self, interval: float = 300.0):
+        """Запускает периодическую синхронизацию каталога в фоновом потоке с интервалом interval, с."""
+        if self._sync_thread is not None or self.read_only:
+            return
+        self._sync_stop.clear()
+        self._sync_thread = threading.Thread(
+            target=self._sync_loop, args=(interval,), name="machine-catalog-sync", daemon=True
+        )
+        self._sync_thread.start()
+
+    def stop_sync(self):
+        """Останавливает периодическую синхронизацию каталога."""
+        self._sync_stop.set()
+        self._sync_thread = None
+
+    def _sync_loop(self, interval: float):
+        """Цикл периодической синхронизации (выполняется в фоновом потоке)."""
+        while not self._sync_stop.wait(interval):
+            try:
+                self.sync()
+            except Exception as error:
+                print(f"Ошибка синхронизации каталога станков: {error}")
+
+    def _fetch_names(self) -> List[str]:
+        """Читает названия станков из базы данных или реплики, заполняя хранилище полными данными."""
+        if self.store is not None:
+            records = self.replica.records() if self.replica is not None else load_all_machines()
+            self.store.put_many(records)
+            return [info.name for info in records]
+        if self.replica is not None:
+            return self.replica.names()
+        return get_session_manager().find_all_names()
+
+    def _extend_chunks(self, names: List[str]):
+        """Добавляет названия в каталог порциями по chunk_size."""
+        for start in range(0, len(names), self.chunk_size):
+            self._extend(names[start : start + self.chunk_size])
+
+    def _extend(self, names: List[str]):
+        """Добавляет порцию названий в каталог."""
+        with self._lock:
+            self._index.add(names)
+            self._fuzzy.add(names)
+            self._version += 1
+
+    def _replace(self, names: List[str]):
+        """Заменяет все названия каталога. Новый индекс строится до замены, поиск по старому не прерывается."""
+        index = NGramIndex(names)
+        fuzzy = FuzzyIndex(names)
+        with self._lock:
+            self._index = index
+            self._fuzzy = fuzzy
+            self._version += 1
+
+    def _compact_index(self):
+        """
+        Заменяет n-граммный индекс новым без удаленных названий, если их накопилось много.
+
+        Вызывается под блокировкой каталога. Поиск выполняется без блокировки, поэтому индекс не перестраивается
+        на месте, а заменяется целиком, как в _replace.
+        """
+        if self._index.needs_compaction:
+            self._index = self._index.compacted()
+
+    def _set_state(self, state: str):
+        """Устанавливает состояние каталога и оповещает обработчики."""
+        with self._lock:
+            self._state = state
+        self._notify()
+
+    def _notify(self):
+        """Оповещает обработчики о текущем состоянии каталога."""
+        for callback in list(self._listeners):
+            callback(self._state)
+
+
+class SearchSession:
+    """
+    Сессия поиска по каталогу для поля ввода с подсказками.
+
+    Хранит все совпадения предыдущего запроса. Если новый запрос содержит предыдущий (пользователь дописал символы),
+    то его совпадения являются подмножеством предыдущих, и фильтруются только они.
+    При удалении символов и при изменении каталога поиск выполняется заново по индексу.
+    Если по подстроке ничего не найдено, результатом становится нечеткий поиск (см. MachineCatalog.fuzzy).
+
+    Результат выдается страницами: search() возвращает первые лучшие названия, more() - следующие.
+
+    Args:
+        catalog (MachineCatalog): Каталог станков
+    """
+
+    def __init__(self, catalog: MachineCatalog):
+        self.catalog = catalog
+        self.reset()
+
+    @property
+    def total(self) -> int:
+        """Количество совпадений для текущего запроса."""
+        return len(self._matches)
+
+    @property
+    def has_more(self) -> bool:
+        """Возвращает True, если для текущего запроса выданы не все совпадения."""
+        return self._returned < len(self._matches)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Возвращает названия, содержащие подстроку query, с учетом совпадений предыдущего запроса.
+
+        Если задан limit, возвращается не более limit лучших названий, остальные можно получить через more().
+        """
+        catalog_version = self.catalog.version
+        fuzzy = False
+        if self._query and self._query in query and catalog_version == self._catalog_version and not self._fuzzy:
+            matches = [name for name in self._matches if query in name]
+        elif query:
+            matches = self.catalog.matches(query)
+        else:
+            matches = list(self.catalog.names)
+        if not matches and query:
+            # Нечеткий поиск возвращает уже упорядоченный результат, ранжирование по подстроке к нему не применяется
+            matches = self.catalog.fuzzy(query)
+            fuzzy = True
+        self._query = query
+        self._matches = matches
+        self._fuzzy = fuzzy
+        self._catalog_version = catalog_version
+        self._returned = 0
+        return self.more(limit)
+
+    def more(self, limit: Optional[int] = None) -> List[str]:
+        """Возвращает следующую страницу результата текущего запроса (не более limit названий)."""
+        if limit is None:
+            end = len(self._matches)
+        else:
+            end = min(self._returned + limit, len(self._matches))
+        if self._fuzzy:
+            page = self._matches[self._returned : end]
+        else:
+            page = self.catalog.rank(self._query, self._matches, end)[self._returned :]
+        self._returned = end
+        return page
+
+    def reset(self):
+        """Сбрасывает сохраненный результат."""
+        self._query = ""
+        self._matches: List[str] = []
+        self._fuzzy = False
+        self._catalog_version = -1
+        self._returned = 0
+
+
+CATALOG = MachineCatalog(store=MachineStore(), snapshot=CatalogSnapshot())
 
 
 def filter_names(name: str) -> list[str]:
     """Фильтрует список машин по имени."""
-    if len(name) == 0:
-        return MACHINE_TOOL_NAMES
-    return [machine_name for machine_name in MACHINE_TOOL_NAMES if name in machine_name]
+    return CATALOG.filter(name)
 
 
-def filter_names1(name: str) -> list[str]:
-    """Фильтрует список машин по имени."""
-    return [machine_name for machine_name in MACHINE_TOOL_NAMES if name in machine_name]
+def find_info(name: str) -> Optional[MachineInfo]:
+    """
+    Возвращает данные станка по названию.
+
+    Данные берутся из хранилища каталога, а при их отсутствии (каталог еще загружается или станок добавлен позже)
+    запрашиваются из базы данных (в автономном режиме - из реплики) и сохраняются в хранилище.
+    """
+    store = CATALOG.store
+    info = store.get(name) if store is not None else None
+    return info if info is not None else load_info(name)
+
+
+def load_info(name: str) -> Optional[MachineInfo]:
+    """
+    Читает актуальные данные станка из базы данных (в автономном режиме - из реплики), минуя хранилище.
+
+    Если данные отличаются от записи хранилища, запись хранилища заменяется прочитанными данными.
+    """
+    info = CATALOG.replica.get(name) if CATALOG.read_only else get_session_manager().info_by_name(name)
+    store = CATALOG.store
+    if info and store is not None and store.get(info.name) != info:
+        store.put(info)
+    return info
+
+
+def use_local_replica(path=None):
+    """
+    Переводит каталог в автономный режим: данные читаются только из локальной реплики, сохранение недоступно.
+
+    Args:
+        path: Путь к файлу реплики (по умолчанию см. local_replica.default_replica_path)
+
+    Raises:
+        FileNotFoundError: Файла реплики нет (реплику нужно создать командой replicate)
+    """
+    replica = LocalReplica(path)
+    replica.check()
+    CATALOG.replica = replica
+    CATALOG.snapshot = None
+
+
+def replicate(path=None) -> int:
+    """
+    Копирует данные всех станков из базы данных в локальную реплику.
+
+    Returns:
+        int: Количество скопированных станков
+    """
+    return LocalReplica(path).replicate(load_all_machines())
 
 
 def info_by_name(name: str) -> dict:
     """Возвращает информацию о машине по имени."""
-    with Finder(limit=None) as finder:
-        finder.set_formatter(ListMachineInfoFormatter())
-        machine = finder.find_by_name(name=name, exact_match=True)
-        print(machine)
-        return machine[0]
+    return get_session_manager().info_by_name(name)
 
 
 if __name__ == "__main__":
-    # print(filter_names(""))
-    #
-    # # Пример строки для поиска
-    # search_str = ""
-    #
-    # # Обернем вызовы функций в лямбды для timeit
-    # t1 = timeit.timeit(lambda: filter_names(search_str), number=1000)
-    # t2 = timeit.timeit(lambda: filter_names1(search_str), number=1000)
-    #
-    # print(f"filter_names:  {t1:.6f} сек")
-    # print(f"filter_names1: {t2:.6f} сек")
-    #
-    # from machine_tools import info_by_name
-    # for name in MACHINE_TOOL_NAMES:
-    #     try:
-    #         info = info_by_name(name)
-    #         if not info:
-    #             print(name)
-    #     except Exception as e:
-    #         print(name)
-    #         print(e)
+    CATALOG.load_async()
+    CATALOG.wait()
+    print(f"Загружено станков: {len(CATALOG.names)}")
 
     info = info_by_name("16К20Ф3")
     print(f"{info.name} {info.software_control}")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит хранилище данных станков в памяти.
+"""
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from machine_tools import MachineInfo
+
+from machine_tools_gui_kivi.src.machine_cache import normalize_name
+
+
+class MachineStore:
+    """
+    Хранилище данных всех станков каталога в памяти.
+
+    Заполняется одним запросом при загрузке каталога (см. machine_finder.load_all_machines), после чего данные станков
+    выдаются без обращения к базе данных. Ключ записи - нормализованное название станка (см. normalize_name).
+
+    ВАЖНО! Хранилище возвращает сами объекты MachineInfo, перед изменением их нужно копировать.
+    """
+
+    def __init__(self, records: Iterable[MachineInfo] = ()):
+        self._lock = threading.Lock()
+        self._records: Dict[str, MachineInfo] = {}
+        self._version = 0
+        self.put_many(records)
+
+    @property
+    def version(self) -> int:
+        """Номер версии данных хранилища (увеличивается при каждом изменении)."""
+        return self._version
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_name(name) in self._records
+
+    def get(self, name: str) -> Optional[MachineInfo]:
+        """Возвращает данные станка или None, если станка нет в хранилище."""
+        return self._records.get(normalize_name(name))
+
+    def put(self, info: MachineInfo):
+        """Добавляет или заменяет данные станка."""
+        with self._lock:
+            self._records[normalize_name(info.name)] = info
+            self._version += 1
+
+    def put_many(self, records: Iterable[MachineInfo]):
+        """Добавляет или заменяет данные нескольких станков."""
+        with self._lock:
+            for info in records:
+                self._records[normalize_name(info.name)] = info
+            self._version += 1
+
+    def remove(self, name: str):
+        """Удаляет данные станка из хранилища."""
+        with self._lock:
+            self._records.pop(normalize_name(name), None)
+            self._version += 1
+
+    def clear(self):
+        """Очищает хранилище."""
+        with self._lock:
+            self._records.clear()
+            self._version += 1
+
+    def records(self) -> List[MachineInfo]:
+        """Возвращает данные всех станков хранилища."""
+        return list(self._records.values())
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит постраничную таблицу станков с сортировкой по столбцам.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from machine_tools import MachineInfo
+
+from machine_tools_gui_kivi.src.facets import FacetIndex
+from machine_tools_gui_kivi.src.local_replica import COLUMNS
+from machine_tools_gui_kivi.src.machine_store import MachineStore
+from machine_tools_gui_kivi.src.range_index import RangeIndex
+
+# Столбцы таблицы: имя столбца (см. local_replica.COLUMNS) -> заголовок
+TABLE_COLUMNS = {
+    "name": "Модель",
+    "machine_group": "Группа",
+    "machine_type": "Тип",
+    "power": "Мощность, кВт",
+    "weight": "Масса, кг",
+    "length": "Длина, мм",
+    "width": "Ширина, мм",
+    "height": "Высота, мм",
+    "accuracy": "Точность",
+    "automation": "Автоматизация",
+}
+
+
+def format_value(value: Any) -> str:
+    """Возвращает текст ячейки таблицы для значения поля станка."""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:g}"
+    return str(value)
+
+
+class MachineTable:
+    """
+    Постраничное представление данных станков хранилища с сортировкой по столбцу и фасетным отбором.
+
+    Данные читаются из хранилища каталога (см. machine_store.MachineStore), без обращений к базе данных.
+    Отсортированный порядок записей вычисляется один раз и пересчитывается только при смене сортировки,
+    отбора или изменении данных хранилища. Отбор по классификационным полям выполняется по фасетному индексу
+    (см. facets.FacetIndex), по диапазонам числовых полей - по отсортированным столбцам (см. range_index.RangeIndex),
+    по названию - функцией matcher. Индексы строятся заново только при изменении данных хранилища.
+
+    Args:
+        store (MachineStore): Хранилище данных станков
+        page_size (int): Количество станков на странице
+        matcher: Функция поиска названий станков по подстроке (например, MachineCatalog.matches)
+    """
+
+    def __init__(
+        self,
+        store: Optional[MachineStore],
+        page_size: int = 100,
+        matcher: Optional[Callable[[str], List[str]]] = None,
+    ):
+        self.store = store
+        self.page_size = page_size
+        self.matcher = matcher
+        self.sort_column = "name"
+        self.descending = False
+        self.selection: Dict[str, frozenset] = {}
+        self.ranges: Dict[str, tuple] = {}
+        self.name_query = ""
+        self._order: List[MachineInfo] = []
+        self._order_key = None
+        self._facets: Optional[FacetIndex] = None
+        self._ranges: Optional[RangeIndex] = None
+        self._indexes_version = None
+
+    @property
+    def total(self) -> int:
+        """Количество станков в таблице с учетом отбора."""
+        return len(self._sorted())
+
+    @property
+    def page_count(self) -> int:
+        """Количество страниц (не меньше одной)."""
+        return max(1, -(-self.total // self.page_size))
+
+    def sort(self, column: str, descending: Optional[bool] = None):
+        """
+        Устанавливает сортировку таблицы.
+
+        Args:
+            column: Имя столбца (см. TABLE_COLUMNS)
+            descending: Сортировка по убыванию. Если не задано, для текущего столбца направление меняется
+                на противоположное, для нового столбца устанавливается сортировка по возрастанию
+        """
+        if column not in TABLE_COLUMNS:
+            raise ValueError(f"Неизвестный столбец таблицы: {column}")
+        if descending is None:
+            descending = not self.descending if column == self.sort_column else False
+        self.sort_column = column
+        self.descending = descending
+
+    def select(self, facet: str, values: Iterable[Any] = ()):
+        """
+        Устанавливает отбор по фасету.
+
+        Args:
+            facet: Имя фасета (см. facets.FACETS)
+            values: Допустимые значения фасета. Пустой набор снимает отбор по фасету
+        """
+        values = frozenset(values)
+        if values:
+            self.selection[facet] = values
+        else:
+            self.selection.pop(facet, None)
+
+    def set_range(self, field: str, low: Optional[float] = None, high: Optional[float] = None):
+        """
+        Устанавливает отбор по диапазону значений числового поля.
+
+        Args:
+            field: Имя поля (см. range_index.RANGE_FIELDS)
+            low: Нижняя граница (включительно), None - не задана
+            high: Верхняя граница (включительно), None - не задана
+        """
+        if low is None and high is None:
+            self.ranges.pop(field, None)
+        else:
+            self.ranges[field] = (low, high)
+
+    def set_name_query(self, query: str):
+        """Устанавливает отбор по вхождению подстроки query в название станка (пустая строка снимает отбор)."""
+        self.name_query = query
+
+    def facet_counts(self) -> Dict[str, Dict[Any, int]]:
+        """Возвращает количество станков по значениям фасетов при текущем отборе (см. FacetIndex.counts)."""
+        return self.facet_index().counts(self.selection)
+
+    def facet_index(self) -> FacetIndex:
+        """Возвращает фасетный индекс данных хранилища (перестраивается при изменении хранилища)."""
+        self._update_indexes()
+        return self._facets
+
+    def range_index(self) -> RangeIndex:
+        """Возвращает индекс числовых полей данных хранилища (перестраивается при изменении хранилища)."""
+        self._update_indexes()
+        return self._ranges
+
+    def _update_indexes(self):
+        """Строит индексы по одному списку записей, чтобы номера станков в них совпадали."""
+        version = self.store.version if self.store is not None else None
+        if self._facets is None or self._indexes_version != version:
+            records = self.store.records() if self.store is not None else []
+            self._facets = FacetIndex(records)
+            self._ranges = RangeIndex(records)
+            self._indexes_version = version
+
+    def page(self, number: int) -> List[MachineInfo]:
+        """Возвращает данные станков страницы number (нумерация с 0)."""
+        start = number * self.page_size
+        return self._sorted()[start : start + self.page_size]
+
+    def rows(self, number: int) -> List[Dict[str, Any]]:
+        """Возвращает строки страницы number: название станка и тексты ячеек в порядке TABLE_COLUMNS."""
+        return [
+            {"machine": info.name, "cells": [format_value(COLUMNS[column](info)) for column in TABLE_COLUMNS]}
+            for info in self.page(number)
+        ]
+
+    def _sorted(self) -> List[MachineInfo]:
+        """Возвращает записи хранилища в порядке текущей сортировки (пустые значения - в конце)."""
+        if self.store is None:
+            return []
+        key = (
+            self.store.version,
+            self.sort_column,
+            self.descending,
+            frozenset(self.selection.items()),
+            frozenset(self.ranges.items()),
+            self.name_query,
+        )
+        if key != self._order_key:
+            getter = COLUMNS[self.sort_column]
+            records = sorted(self._filtered(), key=lambda info: info.name)
+            filled = [info for info in records if getter(info) is not None]
+            empty = [info for info in records if getter(info) is None]
+            filled.sort(key=getter, reverse=self.descending)
+            self._order = filled + empty
+            self._order_key = key
+        return self._order
+
+    def _filtered(self) -> List[MachineInfo]:
+        """Возвращает записи хранилища, удовлетворяющие фасетному отбору, диапазонам и отбору по названию."""
+        if not (self.selection or self.ranges or self.name_query):
+            return self.store.records()
+        facets = self.facet_index()
+        bitmap = facets.bitmap(self.selection) & self.range_index().bitmap(self.ranges)
+        records = facets.records_of(bitmap)
+        if self.name_query and self.matcher is not None:
+            names = set(self.matcher(self.name_query))
+            records = [info for info in records if info.name in names]
+        return records
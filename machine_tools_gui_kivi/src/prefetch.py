@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит упреждающую загрузку данных станков в кэш.
+"""
+import threading
+import time
+from collections import deque
+from typing import Callable, Iterable, Optional
+
+from machine_tools import MachineInfo
+
+from machine_tools_gui_kivi.src.machine_cache import MachineInfoCache
+
+
+class MachinePrefetcher:
+    """
+    Упреждающая загрузка данных станков в кэш в одном фоновом потоке.
+
+    Очередь ограничена maxsize названиями: при переполнении отбрасываются самые старые запросы.
+    Между запросами к базе данных выдерживается пауза delay, поэтому загрузка не создает заметной нагрузки на базу.
+    Станки, уже находящиеся в кэше, не загружаются.
+
+    Args:
+        cache (MachineInfoCache): Кэш данных станков
+        loader: Функция загрузки данных станка по названию
+        maxsize (int): Максимальная длина очереди
+        delay (float): Пауза между запросами к базе данных, с
+    """
+
+    def __init__(
+        self,
+        cache: MachineInfoCache,
+        loader: Callable[[str], Optional[MachineInfo]],
+        maxsize: int = 10,
+        delay: float = 0.05,
+    ):
+        self.cache = cache
+        self.loader = loader
+        self.delay = delay
+        self._queue = deque(maxlen=maxsize)
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def prefetch(self, names: Iterable[str]):
+        """Заменяет очередь загрузки названиями names (например, первыми результатами поиска)."""
+        with self._condition:
+            self._queue.clear()
+            self._queue.extend(name for name in names if name not in self.cache)
+            self._condition.notify()
+        self._ensure_thread()
+
+    def prefetch_first(self, name: str):
+        """Ставит название name в начало очереди загрузки (например, станок под курсором)."""
+        if name in self.cache:
+            return
+        with self._condition:
+            if name in self._queue:
+                self._queue.remove(name)
+            self._queue.appendleft(name)
+            self._condition.notify()
+        self._ensure_thread()
+
+    def clear(self):
+        """Очищает очередь загрузки."""
+        with self._condition:
+            self._queue.clear()
+
+    def _ensure_thread(self):
+        """Запускает фоновый поток, если он еще не запущен."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="machine-prefetch", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Цикл фонового потока: загружает станки из очереди по одному."""
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+                name = self._queue.popleft()
+            try:
+                self.cache.get_or_load(name, self.loader)
+            except Exception as error:
+                print(f"Ошибка упреждающей загрузки станка {name}: {error}")
+            time.sleep(self.delay)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит индекс числовых полей станков для запросов по диапазону значений
+(например, мощность от 5 до 15 кВт и длина до 3000 мм).
+"""
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from machine_tools import MachineInfo
+
+from machine_tools_gui_kivi.src.facets import bitmap_from_numbers, numbers_from_bitmap
+from machine_tools_gui_kivi.src.local_replica import COLUMNS
+
+# Числовые поля: имя поля -> функция получения значения из MachineInfo
+RANGE_FIELDS: Dict[str, Callable[[MachineInfo], Optional[float]]] = {
+    "power": COLUMNS["power"],
+    "efficiency": COLUMNS["efficiency"],
+    "weight": COLUMNS["weight"],
+    "length": COLUMNS["length"],
+    "width": COLUMNS["width"],
+    "height": COLUMNS["height"],
+    "overall_diameter": lambda info: info.dimensions.overall_diameter if info.dimensions else None,
+}
+
+
+def to_number(value) -> Optional[float]:
+    """
+    Приводит значение поля к числу.
+
+    Значения, введенные в редакторе, могут попасть в данные станка строкой (например, overall_diameter),
+    поэтому строки с числом преобразуются, а пустые и нечисловые значения возвращаются как None.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if number != number else number  # NaN не сравнивается и в столбец не входит
+
+
+# Границы диапазонов по полям: имя поля -> (нижняя граница, верхняя граница), None - граница не задана
+Ranges = Dict[str, Tuple[Optional[float], Optional[float]]]
+
+
+class RangeIndex:
+    """
+    Отсортированные столбцы числовых полей станков.
+
+    Для каждого поля хранятся значения по возрастанию и порядковые номера станков в том же порядке,
+    поэтому отбор по диапазону - это два двоичных поиска и срез. Значения приводятся к числу (см. to_number);
+    станки без значения поля или с нечисловым значением в столбец не входят и в отбор по этому полю не попадают.
+
+    Номера станков совпадают с номерами фасетного индекса, построенного по тем же записям (см. facets.FacetIndex),
+    поэтому результаты объединяются пересечением битовых масок.
+
+    Args:
+        records: Данные станков
+        fields: Числовые поля (по умолчанию RANGE_FIELDS)
+    """
+
+    def __init__(self, records: Iterable[MachineInfo] = (), fields: Optional[Dict[str, Callable]] = None):
+        self.fields = fields if fields is not None else RANGE_FIELDS
+        self._records: List[MachineInfo] = list(records)
+        self._values: Dict[str, List[float]] = {}
+        self._numbers: Dict[str, List[int]] = {}
+        for field, getter in self.fields.items():
+            column = sorted(
+                (value, number)
+                for number, value in ((number, to_number(getter(info))) for number, info in enumerate(self._records))
+                if value is not None
+            )
+            self._values[field] = [value for value, _ in column]
+            self._numbers[field] = [number for _, number in column]
+
+    def __len__(self):
+        return len(self._records)
+
+    def bounds(self, field: str) -> Tuple[Optional[float], Optional[float]]:
+        """Возвращает наименьшее и наибольшее значение поля (None, если значений нет)."""
+        values = self._values[field]
+        return (values[0], values[-1]) if values else (None, None)
+
+    def numbers(self, field: str, low: Optional[float] = None, high: Optional[float] = None) -> List[int]:
+        """Возвращает номера станков, у которых значение поля field находится в диапазоне [low, high]."""
+        values = self._values[field]
+        start = bisect_left(values, low) if low is not None else 0
+        stop = bisect_right(values, high) if high is not None else len(values)
+        return self._numbers[field][start:stop]
+
+    def bitmap(self, ranges: Ranges) -> int:
+        """Возвращает битовую маску станков, удовлетворяющих всем диапазонам ranges."""
+        result = (1 << len(self._records)) - 1
+        for field, (low, high) in ranges.items():
+            if low is None and high is None:
+                continue
+            result &= bitmap_from_numbers(self.numbers(field, low, high), len(self._records))
+        return result
+
+    def records(self, ranges: Ranges) -> List[MachineInfo]:
+        """Возвращает данные станков, удовлетворяющих всем диапазонам ranges, по возрастанию номера."""
+        return [self._records[number] for number in numbers_from_bitmap(self.bitmap(ranges))]
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит очередь сохранения измененных данных станков в базу данных.
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from machine_tools import MachineInfo
+
+from machine_tools_gui_kivi.src.machine_cache import normalize_name
+from machine_tools_gui_kivi.src.machine_diff import MachineDiff
+
+
+class SaveQueue:
+    """
+    Очередь сохранения данных станков, записывающая изменения пакетами в фоновом потоке.
+
+    В очередь ставятся не полные данные станка, а различия (MachineDiff) относительно исходных данных base.
+    Перед записью текущие данные станка перечитываются функцией reader, и изменения применяются к ним, поэтому
+    поля, измененные в базе данных другими пользователями, не перезаписываются. Данные base используются,
+    только если перечитать станок не удалось.
+    Повторные изменения станка, еще не записанного в базу данных, объединяются с предыдущими.
+    Пакет записывается, когда в очереди набирается max_batch станков или через flush_delay секунд после
+    последнего изменения, а также по вызову flush().
+
+    Args:
+        writer: Функция записи данных станка в базу данных, возвращает True при успехе
+        reader: Функция чтения текущих данных станка из базы данных по названию (None - не перечитывать)
+        on_saved: Функция, вызываемая после записи станка: on_saved(old_name, info, result).
+            ВАЖНО! Вызывается из фонового потока
+        max_batch (int): Количество станков, при котором пакет записывается сразу
+        flush_delay (float): Задержка записи пакета после последнего изменения, с
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[MachineInfo], bool],
+        reader: Optional[Callable[[str], Optional[MachineInfo]]] = None,
+        on_saved: Optional[Callable[[str, MachineInfo, bool], None]] = None,
+        max_batch: int = 50,
+        flush_delay: float = 2.0,
+    ):
+        self.writer = writer
+        self.reader = reader
+        self.on_saved = on_saved
+        self.max_batch = max_batch
+        self.flush_delay = flush_delay
+        self._pending: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def __len__(self):
+        return len(self._pending)
+
+    def is_pending(self, name: str) -> bool:
+        """Возвращает True, если в очереди есть не записанные изменения станка name (по названию после изменений)."""
+        with self._lock:
+            return normalize_name(name) in self._pending
+
+    def enqueue(self, old_name: str, base: MachineInfo, diff: MachineDiff):
+        """
+        Ставит изменения станка в очередь записи.
+
+        Args:
+            old_name: Название станка в базе данных до изменения
+            base: Данные станка, к которым применяются изменения
+            diff: Изменения станка
+        """
+        key = normalize_name(old_name)
+        with self._lock:
+            if key in self._pending:
+                # Станок еще не записан: сохраняем исходное название и данные, объединяем изменения
+                old_name, base, queued_diff = self._pending.pop(key)
+                diff = queued_diff.merge(diff)
+            # Дальнейшие изменения станка будут приходить под новым названием
+            self._pending[normalize_name(diff.fields.get("name", old_name))] = (old_name, base, diff)
+            full = len(self._pending) >= self.max_batch
+        if full:
+            self.flush()
+        else:
+            self._restart_timer()
+
+    def flush(self, wait: bool = False):
+        """
+        Записывает все станки из очереди в фоновом потоке.
+
+        Args:
+            wait: Дождаться окончания записи
+        """
+        self._cancel_timer()
+        thread = threading.Thread(target=self._write_pending, name="machine-save-queue", daemon=True)
+        thread.start()
+        if wait:
+            thread.join()
+
+    def _write_pending(self):
+        """Записывает накопленный пакет (выполняется в фоновом потоке)."""
+        with self._write_lock:
+            with self._lock:
+                batch: Dict[str, tuple] = self._pending
+                self._pending = OrderedDict()
+            if not batch:
+                return
+            print(f"Записываем в БД изменения станков: {len(batch)}")
+            for old_name, base, diff in batch.values():
+                info = diff.apply(self._current(old_name, base))
+                print(f"Изменения станка {old_name}: {diff}")
+                try:
+                    result = bool(self.writer(info))
+                except Exception as error:
+                    print(f"Ошибка при записи станка {info.name}: {error}")
+                    result = False
+                if self.on_saved:
+                    self.on_saved(old_name, info, result)
+
+    def _current(self, name: str, base: MachineInfo) -> MachineInfo:
+        """Возвращает текущие данные станка из базы данных, а если их не удалось прочитать - данные base."""
+        if self.reader is None:
+            return base
+        try:
+            current = self.reader(name)
+        except Exception as error:
+            print(f"Ошибка чтения станка {name} перед записью, изменения применяются к локальным данным: {error}")
+            return base
+        return current or base
+
+    def _restart_timer(self):
+        """Перезапускает таймер отложенной записи пакета."""
+        self._cancel_timer()
+        self._timer = threading.Timer(self.flush_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self):
+        """Останавливает таймер отложенной записи пакета."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит n-граммный индекс для поиска названий станков по подстроке.
+"""
+import heapq
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class NGramIndex:
+    """
+    Индекс названий по n-граммам длиной от 1 до max_n символов.
+
+    Для каждой n-граммы хранится список номеров названий, в которые она входит. Номера выдаются по порядку
+    добавления, поэтому списки всегда отсортированы и при дополнении индекса только удлиняются.
+
+    Поиск подстроки длиной не больше max_n сводится к одному списку, для более длинной подстроки
+    проверяются только названия из самого короткого списка среди ее n-грамм.
+
+    Удаленные названия помечаются и пропускаются при поиске; когда их становится больше половины,
+    владелец индекса заменяет его новым индексом без удаленных названий (см. needs_compaction, compacted).
+    Индекс не перестраивается на месте, поэтому поиск, выполняемый в другом потоке без блокировки,
+    всегда видит согласованные номера и названия.
+
+    Args:
+        names: Начальный список названий
+        max_n (int): Максимальная длина n-граммы
+    """
+
+    # Ранги совпадений: полное совпадение, совпадение начала, вхождение подстроки
+    EXACT = 0
+    PREFIX = 1
+    SUBSTRING = 2
+
+    def __init__(self, names: Iterable[str] = (), max_n: int = 3):
+        self.max_n = max_n
+        self._names: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._ids: Dict[str, int] = {}
+        self._deleted: Set[int] = set()
+        self._live: Optional[List[str]] = None
+        self.add(names)
+
+    def __len__(self):
+        return len(self._names) - len(self._deleted)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    @property
+    def names(self) -> List[str]:
+        """Проиндексированные (не удаленные) названия в порядке добавления."""
+        if not self._deleted:
+            return self._names
+        live = self._live
+        if live is None:
+            live = self._live = [name for name_id, name in enumerate(self._names) if name_id not in self._deleted]
+        return live
+
+    def add(self, names: Iterable[str]):
+        """Добавляет названия в индекс. Уже проиндексированные названия пропускаются."""
+        for name in names:
+            if name in self._ids:
+                continue
+            name_id = len(self._names)
+            self._names.append(name)
+            self._ids[name] = name_id
+            for gram in self._grams(name):
+                self._postings.setdefault(gram, []).append(name_id)
+        self._live = None
+
+    def remove(self, names: Iterable[str]):
+        """Удаляет названия из индекса."""
+        for name in names:
+            name_id = self._ids.pop(name, None)
+            if name_id is not None:
+                self._deleted.add(name_id)
+        self._live = None
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Возвращает True, если удаленных названий больше половины и индекс пора заменить (см. compacted)."""
+        return len(self._deleted) * 2 > len(self._names)
+
+    def compacted(self) -> "NGramIndex":
+        """Возвращает новый индекс с теми же названиями, но без удаленных (текущий индекс не изменяется)."""
+        return NGramIndex(self.names, self.max_n)
+
+    def candidates(self, query: str) -> List[int]:
+        """Возвращает номера названий, которые могут содержать подстроку query."""
+        if len(query) <= self.max_n:
+            return self._postings.get(query, [])
+        shortest = None
+        for start in range(len(query) - self.max_n + 1):
+            posting = self._postings.get(query[start : start + self.max_n])
+            if not posting:
+                return []
+            if shortest is None or len(posting) < len(shortest):
+                shortest = posting
+        return shortest
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Возвращает названия, содержащие подстроку query.
+
+        Результат упорядочен по рангу совпадения (полное > начало > подстрока), затем по позиции вхождения,
+        затем по порядку добавления в индекс. Для пустого запроса возвращаются все названия.
+        Если задан limit, возвращается не более limit лучших названий.
+        """
+        if len(query) == 0:
+            return list(self.names[:limit])
+        return self.rank(query, self.matches(query), limit)
+
+    def matches(self, query: str) -> List[str]:
+        """Возвращает названия, содержащие подстроку query, в порядке добавления (без ранжирования)."""
+        names, deleted = self._names, self._deleted
+        return [
+            names[name_id] for name_id in self.candidates(query) if query in names[name_id] and name_id not in deleted
+        ]
+
+    def search_within(self, query: str, names: List[str], limit: Optional[int] = None) -> List[str]:
+        """Возвращает названия из списка names, содержащие подстроку query, упорядоченные как в search()."""
+        return self.rank(query, [name for name in names if query in name], limit)
+
+    def rank(self, query: str, names: List[str], limit: Optional[int] = None) -> List[str]:
+        """
+        Упорядочивает названия names, содержащие подстроку query, как в search().
+
+        Если задан limit, выбираются limit лучших названий с помощью кучи без сортировки всего списка.
+        При равных ключах сохраняется порядок names.
+        """
+        keys = ((self.rank_key(name, query, name.find(query)), i) for i, name in enumerate(names))
+        if limit is None:
+            ranked = sorted(keys)
+        else:
+            ranked = heapq.nsmallest(limit, keys)
+        return [names[i] for _, i in ranked]
+
+    def rank_key(self, name: str, query: str, position: int) -> tuple:
+        """Возвращает ключ ранжирования названия name для запроса query."""
+        if position == 0:
+            return (self.EXACT if len(name) == len(query) else self.PREFIX, 0)
+        return self.SUBSTRING, position
+
+    def _grams(self, name: str) -> set:
+        """Возвращает множество n-грамм названия длиной от 1 до max_n."""
+        return {name[i : i + n] for n in range(1, self.max_n + 1) for i in range(len(name) - n + 1)}
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Модуль содержит локальный снимок каталога станков на диске.
+
+Снимок хранится в файле SQLite, который открывается с отображением в память (PRAGMA mmap_size),
+поэтому при повторном запуске приложения каталог доступен для поиска без обращения к базе данных.
+"""
+import os
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import List, Optional, Union
+
+SNAPSHOT_VERSION = 1  # Версия формата файла снимка
+
+
+def default_snapshot_path() -> Path:
+    """Возвращает путь к файлу снимка по умолчанию (в домашнем каталоге пользователя)."""
+    return Path.home() / ".machine_tools_gui_kivi" / "catalog.sqlite3"
+
+
+class CatalogSnapshot:
+    """
+    Снимок списка названий станков в файле SQLite.
+
+    Файл содержит таблицу meta с версией формата и временем сохранения и таблицу names с названиями
+    в порядке каталога. Снимок другой версии формата считается отсутствующим.
+
+    Args:
+        path: Путь к файлу снимка
+        mmap_size (int): Размер области файла, отображаемой в память, байт
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, mmap_size: int = 64 * 1024 * 1024):
+        self.path = Path(path) if path else default_snapshot_path()
+        self.mmap_size = mmap_size
+
+    def exists(self) -> bool:
+        """Возвращает True, если файл снимка существует."""
+        return self.path.is_file()
+
+    def connect(self) -> sqlite3.Connection:
+        """Открывает соединение с файлом снимка, создавая каталог файла при необходимости."""
+        os.makedirs(self.path.parent, exist_ok=True)
+        connection = sqlite3.connect(str(self.path))
+        connection.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        connection.execute("CREATE TABLE IF NOT EXISTS names (position INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+        return connection
+
+    def get_meta(self, connection: sqlite3.Connection, key: str) -> Optional[str]:
+        """Возвращает значение из таблицы meta или None."""
+        row = connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, connection: sqlite3.Connection, key: str, value):
+        """Записывает значение в таблицу meta."""
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def is_valid(self, connection: sqlite3.Connection) -> bool:
+        """Возвращает True, если снимок сохранен в текущей версии формата."""
+        return self.get_meta(connection, "version") == str(SNAPSHOT_VERSION)
+
+    def load_names(self) -> Optional[List[str]]:
+        """Возвращает названия станков из снимка или None, если снимка нет или он другой версии."""
+        if not self.exists():
+            return None
+        try:
+            with closing(self.connect()) as connection, connection:
+                if not self.is_valid(connection):
+                    return None
+                return [row[0] for row in connection.execute("SELECT name FROM names ORDER BY position")]
+        except sqlite3.Error as error:
+            print(f"Ошибка чтения снимка каталога {self.path}: {error}")
+            return None
+
+    def save_names(self, names: List[str]):
+        """Сохраняет названия станков в снимок (заменяя предыдущие) одной транзакцией."""
+        try:
+            with closing(self.connect()) as connection, connection:
+                connection.execute("DELETE FROM names")
+                connection.executemany("INSERT INTO names (position, name) VALUES (?, ?)", enumerate(names))
+                self.set_meta(connection, "version", SNAPSHOT_VERSION)
+                self.set_meta(connection, "saved_at", time.time())
+        except sqlite3.Error as error:
+            print(f"Ошибка записи снимка каталога {self.path}: {error}")